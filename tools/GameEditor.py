@@ -4,21 +4,181 @@ Game Object Editor - A tool to view and edit game objects (tiles, characters, et
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-import toml
+from tkinter import ttk, messagebox
+import hashlib
 import json
+import pickle
 from pathlib import Path
-from PIL import Image, ImageTk
+from PIL import Image, ImageDraw, ImageTk
 import os
 import subprocess
 import signal
+import socket
 import platform
-import random
-import math
-import urllib.request
-import urllib.error
+import queue
+import threading
+import time
+import urllib.error  # urllib.request (http/email/ssl) is imported where it's used
+from functools import lru_cache, partial
+from types import MappingProxyType
+
+try:
+    import tomllib  # Python 3.11+, faster than the toml package for reading
+except ImportError:
+    tomllib = None
+
+def _sprites_from_legacy(obj):
+    """Build a sprites list from legacy sprite_x/sprite_y, or an empty one"""
+    if "sprite_x" in obj and "sprite_y" in obj:
+        return [{"x": obj["sprite_x"], "y": obj["sprite_y"]}]
+    return []
+
+
+def _safe_int(val, default=0):
+    """Parse a stripped form value as an int, or return default (no exception on bad input)"""
+    digits = val[1:] if val[:1] == "-" else val
+    return int(val) if digits.isdecimal() else default
+
+
+def _find_listening_pid_proc(port):
+    """Find the PID listening on a TCP port by reading /proc (Linux), or None
+
+    Only processes whose fds we may read are found - the caller falls back to lsof.
+    """
+    inodes = set()
+    local_suffix = f":{port:04X}"
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table) as f:
+                next(f, None)  # Header
+                for line in f:
+                    fields = line.split()
+                    # fields: sl, local_address, rem_address, st (0A = LISTEN), ..., inode
+                    if len(fields) > 9 and fields[3] == "0A" and fields[1].endswith(local_suffix):
+                        inodes.add(f"socket:[{fields[9]}]")
+        except OSError:
+            continue
+    if not inodes:
+        return None
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        try:
+            for fd in os.scandir(f"/proc/{entry.name}/fd"):
+                if os.readlink(fd.path) in inodes:
+                    return int(entry.name)
+        except OSError:
+            continue  # Gone, or not ours to inspect
+    return None
+
+
+def _is_monster(obj):
+    """True for character objects flagged as monsters (bool, "true" string, or legacy properties)"""
+    if obj.get("object_type") != "character":
+        return False
+    monster = obj.get("monster", False)
+    if isinstance(monster, bool) and monster:
+        return True
+    if isinstance(monster, str) and monster.lower() == "true":
+        return True
+    return "properties" in obj and obj["properties"].get("monster") == "true"
+
+
+# Entry in the editor's dirty set for level edits (object edits use the object id)
+_LEVELS_DIRTY = ("levels",)
+
+# Integer fields stored top-level on the object, where blank means None
+_OPTIONAL_INT_FIELDS = frozenset({
+    "health", "attack", "defense", "attack_spread_percent",
+    "crit_chance_percent", "crit_damage_percent", "healing_power",
+})
+
+# Auto-fix defaults keyed by (object_type, field); None matches any object type
+_DEFAULT_FACTORIES = {
+    ("consumable", "healing_power"): lambda obj: 20,
+    (None, "sprites"): _sprites_from_legacy,
+}
+
+
+# The OS can't change while we run - resolve it once for the server helpers
+_SYSTEM = platform.system()
+
+
+def _read_toml(path):
+    """Parse a TOML file, preferring the stdlib tomllib over the toml package"""
+    if tomllib is not None:
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    import toml
+    with open(path, 'r') as f:
+        return toml.load(f)
+
+
+def _dumps_toml(data):
+    """Serialize data as a TOML string (toml is only needed for writing)"""
+    import toml
+    return toml.dumps(data)
+
+
+def _snapshot_digest(data):
+    """Content digest of a pickled config snapshot, used to skip unchanged writes"""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+# Largest level map drawn as a single composited image (4096x4096, 64 MB as RGBA)
+_MAX_COMPOSITE_PIXELS = 4096 * 4096
+
+
+@lru_cache(maxsize=16)
+def _load_sprite_sheet_image(path, mtime):
+    """Decode a sprite sheet PNG, cached per path and modification time"""
+    with Image.open(path) as img:
+        return img.convert("RGBA")
+
+
+@lru_cache(maxsize=4)
+def _resize_sprite_sheet_image(path, mtime, zoom):
+    """Return a sprite sheet scaled to a zoom level, cached per path, mtime and zoom
+
+    Kept small because zoomed-in sheets are large (an 8x sheet can be tens of MB).
+    """
+    image = _load_sprite_sheet_image(path, mtime)
+    if zoom == 1.0:
+        return image  # Already cached by _load_sprite_sheet_image - no copy needed
+    new_width = int(image.width * zoom)
+    new_height = int(image.height * zoom)
+    # Pixel-art sheets: NEAREST keeps tile edges crisp and is much cheaper than LANCZOS
+    return image.resize((new_width, new_height), Image.Resampling.NEAREST)
+
+
+@lru_cache(maxsize=512)
+def _crop_sprite_tile(path, mtime, x, y, tile_size, scaled_size):
+    """Crop one tile from a sprite sheet and scale it, cached per sheet version, tile and size"""
+    image = _load_sprite_sheet_image(path, mtime)
+    left = x * tile_size
+    top = y * tile_size
+    tile = image.crop((left, top, left + tile_size, top + tile_size))
+    if scaled_size == tile_size:
+        return tile  # Native size (e.g. the composite, or 100% zoom) - nothing to resample
+    return tile.resize((scaled_size, scaled_size), Image.Resampling.NEAREST)
+
+
+@lru_cache(maxsize=8)
+def _placeholder_tile(size):
+    """Gray tile with a black outline, drawn for map tiles that have no sprite"""
+    tile = Image.new("RGBA", (size, size), "gray")
+    ImageDraw.Draw(tile).rectangle((0, 0, size - 1, size - 1), outline="black")
+    return tile
+
 
 class GameObjectEditor:
+    # Property dtype -> (Tk variable class, widget class, variable option, extra widget options)
+    _PROPERTY_WIDGETS = {
+        bool: (tk.BooleanVar, ttk.Checkbutton, "variable", {}),
+        int: (tk.StringVar, ttk.Entry, "textvariable", {"width": 20}),
+        str: (tk.StringVar, ttk.Entry, "textvariable", {"width": 20}),
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Game Editor")
@@ -34,19 +194,52 @@ class GameObjectEditor:
         # Data
         self.config = None
         self.current_object = None
+        self.current_object_idx = None  # Index of current_object in game_objects
         self.sprite_sheet_image = None
         self.sprite_sheet_photo = None
         self.original_sprite_image = None  # Original full-size image
         self.zoom_level = 1.0  # Current zoom level (1.0 = 100%)
+        self._displayed_zoom = None  # Zoom level the canvas currently shows
+        self._sheet_item_id = None  # Persistent canvas item showing the sprite sheet
+        self._last_highlight_key = None  # (sheet, zoom, sprite coords) currently highlighted
         self.tile_size = 32  # Size of each tile in pixels
         self.server_process = None  # Reference to running server process
+        self._server_running = None  # Last probed server state (None = not probed yet)
+        self._server_pid_cache = None  # (pid, time.monotonic()) from the last find_server_process
         self.schema = None  # Dynamic schema loaded from server
+        self._display_cache = None  # (list text, lowercased list text) per object (None = rebuild)
+        self._objects_version = 0  # Bumped whenever game_objects (or an object in it) changes
+        self._monsters_cache = None  # (objects version, monsters sorted by name)
+        self._map_lookups_cache = None  # (objects version, _get_map_object_lookups result)
+        self._culled_map_views = {}  # canvas path -> (scaled_size, offset_x, offset_y, photos) when drawn per tile
+        self._visible_indices = []  # game_objects index shown on each object list row
+        self._objects_dirty = True  # Object list rows need rebuilding
+        self._list_filter_snapshot = None  # Filter text the object list was last built with
+        self._sheets_cache = None  # (assets dir mtime_ns, sorted sprite sheet names)
+        self._filter_job = None  # Pending debounced filter refresh
+        self._dirty_ids = set()  # Objects edited in memory but not yet written to disk
+        self._flush_job = None  # Pending coalesced config write
+        self._last_save = 0.0  # time.monotonic() of the last config write
+        self._save_queue = queue.Queue()  # Results from background config writes
+        self._save_lock = threading.Lock()  # Serializes config file writes
+        self._save_generation = 0  # Bumped per snapshot; stale snapshots are not written
+        self._saves_in_flight = 0
+        self._last_saved_hash = None  # Digest of the last snapshot handed to the writer
+        self._validation_schema = None  # Built lazily by _get_validation_schema
+        self._auto_save_job = None  # Pending debounced property form save
+        self._level_save_job = None  # Pending debounced level form save
+        self._level_save_index = None  # Level that pending save writes into
+        self._map_render_jobs = {}  # render method name -> pending after_idle zoom redraw
+        self._valid_objects = {}  # id(obj) -> obj for objects that passed validation and weren't edited since
         
         # Fullscreen map preview
         self.level_map_fullscreen_window = None
         self.level_map_fullscreen_canvas = None
         self.level_map_fullscreen_zoom_level = 1.0
         
+        # Write pending edits before the window goes away
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         # Load schema first (needed for UI creation)
         self.load_schema()
         
@@ -85,6 +278,9 @@ class GameObjectEditor:
         # Build Level Editor tab UI
         self.create_level_tab_ui()
         
+        # Don't leave edits waiting on the save timer when switching tabs
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self._flush_pending_edits(wait=False))
+        
         # Bottom - Action buttons and status (shared across tabs)
         bottom_frame = ttk.Frame(main_frame)
         bottom_frame.grid(row=1, column=0, pady=(10, 0), sticky=(tk.W, tk.E))
@@ -102,8 +298,8 @@ class GameObjectEditor:
         self.status_label = ttk.Label(status_frame, text="Ready", foreground="gray", wraplength=400)
         self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
-        # Check server status on startup
-        self.root.after(1000, self.check_server_status)
+        # Check server status on startup, then watch for it starting/stopping
+        self.root.after(1000, self._watch_server_status)
         
         # Status logging method
         self.log_status("Editor ready")
@@ -127,7 +323,7 @@ class GameObjectEditor:
         filter_frame.pack(fill=tk.X, pady=(10, 5))
         ttk.Label(filter_frame, text="Filter:").pack(side=tk.LEFT)
         self.filter_var = tk.StringVar()
-        self.filter_var.trace('w', self.filter_objects)
+        self.filter_var.trace_add("write", self._schedule_filter)
         filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_var, width=15)
         filter_entry.pack(side=tk.LEFT, padx=(5, 0))
         
@@ -138,7 +334,10 @@ class GameObjectEditor:
         scrollbar = ttk.Scrollbar(list_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.object_listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar.set, width=30)
+        # Rows come from a list variable so a refresh is one assignment, not N inserts
+        self._object_list_var = tk.Variable(value=())
+        self.object_listbox = tk.Listbox(list_frame, listvariable=self._object_list_var,
+                                         yscrollcommand=scrollbar.set, width=30)
         self.object_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.object_listbox.bind('<<ListboxSelect>>', self.on_object_select)
         scrollbar.config(command=self.object_listbox.yview)
@@ -153,34 +352,80 @@ class GameObjectEditor:
         middle_panel = ttk.LabelFrame(self.objects_tab, text="Properties", padding="10")
         middle_panel.grid(row=0, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=(0, 10))
         
-        # Build property schema dynamically from loaded schema
-        # Filter out hidden fields (label=None) and build schema dict
-        self.property_schema = {}
-        if self.schema and "fields" in self.schema:
-            for field in self.schema["fields"]:
-                if field.get("label") is None:  # Skip hidden fields
-                    continue
-                
-                field_name = field["name"]
-                field_type = field["field_type"]
-                show_for_types = field.get("show_for_types", [])
-                label = field.get("label", field_name.capitalize())
-                
-                # Map Rust types to Python types
-                if field_type == "bool" or field_type == "Option<bool>":
-                    dtype = bool
-                elif "i32" in field_type or "u32" in field_type:
-                    dtype = int
-                else:
-                    dtype = str
-                
-                # Determine if always show (empty show_for_types means show for all)
-                always_show = len(show_for_types) == 0
-                
-                self.property_schema[field_name] = (f"{label}:", field_name, dtype, always_show, show_for_types)
-        else:
-            # Fallback to empty schema if schema not loaded
-            self.property_schema = {}
+        self._build_property_panel(middle_panel)
+        
+        # Custom properties removed - all properties are now defined in schema
+        
+        # Note: Save is now handled by the main "Save" button at the bottom
+        
+        # Store last clicked coordinates for adding sprites
+        self.last_clicked_sprite = None
+        
+        # Right panel - Sprite preview
+        right_panel = ttk.LabelFrame(self.objects_tab, text="Sprite Preview", padding="10")
+        right_panel.grid(row=0, column=2, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Canvas with scrollbars
+        canvas_frame = ttk.Frame(right_panel)
+        canvas_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Scrollbars
+        v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL)
+        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        h_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL)
+        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        self.sprite_canvas = tk.Canvas(canvas_frame, width=400, height=400, bg="gray",
+                                       yscrollcommand=v_scrollbar.set,
+                                       xscrollcommand=h_scrollbar.set)
+        self.sprite_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        v_scrollbar.config(command=self.sprite_canvas.yview)
+        h_scrollbar.config(command=self.sprite_canvas.xview)
+        
+        # Sprite sheet selection
+        sheet_frame = ttk.Frame(right_panel)
+        sheet_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Label(sheet_frame, text="Sprite Sheet:").pack(side=tk.LEFT, padx=(0, 5))
+        self.sprite_sheet_var = tk.StringVar()
+        self.sprite_sheet_combo = ttk.Combobox(sheet_frame, textvariable=self.sprite_sheet_var, 
+                                                state="readonly", width=30)
+        self.sprite_sheet_combo.pack(side=tk.LEFT, padx=(0, 5))
+        self.sprite_sheet_combo.bind("<<ComboboxSelected>>", self.on_sprite_sheet_change)
+        ttk.Button(sheet_frame, text="Refresh", command=self.refresh_sprite_sheets, width=8).pack(side=tk.LEFT)
+        
+        # Sprite sheet navigation and zoom controls
+        nav_frame = ttk.Frame(right_panel)
+        nav_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Label(nav_frame, text="Click on sprite sheet to set coordinates").pack()
+        
+        # Zoom controls
+        zoom_frame = ttk.Frame(nav_frame)
+        zoom_frame.pack(pady=(5, 0))
+        ttk.Button(zoom_frame, text="Zoom In (+)", command=self.zoom_in, width=12).pack(side=tk.LEFT, padx=2)
+        ttk.Button(zoom_frame, text="Zoom Out (-)", command=self.zoom_out, width=12).pack(side=tk.LEFT, padx=2)
+        ttk.Button(zoom_frame, text="Reset (1x)", command=self.zoom_reset, width=12).pack(side=tk.LEFT, padx=2)
+        self.zoom_label = ttk.Label(zoom_frame, text="Zoom: 100%")
+        self.zoom_label.pack(side=tk.LEFT, padx=(10, 0))
+        
+        self.sprite_canvas.bind("<Button-1>", self.on_sprite_click)
+        # Mouse wheel support (different on different platforms)
+        self.sprite_canvas.bind("<MouseWheel>", self.on_mousewheel)  # Windows/Linux
+        self.sprite_canvas.bind("<Button-4>", lambda e: self.zoom_in())  # macOS scroll up
+        self.sprite_canvas.bind("<Button-5>", lambda e: self.zoom_out())  # macOS scroll down
+        # Make canvas focusable for mouse wheel
+        self.sprite_canvas.bind("<Enter>", lambda e: self.sprite_canvas.focus_set())
+        self.sprite_canvas.bind("<Leave>", lambda e: self.root.focus_set())
+        
+        # Configure grid weights for objects tab
+        self.objects_tab.columnconfigure(1, weight=1)
+        self.objects_tab.rowconfigure(0, weight=1)
+    
+    def _build_property_panel(self, middle_panel):
+        """Build the property form, sprite list and interactable section from the current schema"""
+        # Property schema is compiled once per loaded schema
+        self.property_schema = self._compiled_schema
         
         # Properties form
         self.prop_vars = {}
@@ -196,34 +441,36 @@ class GameObjectEditor:
             self.prop_labels[key] = label_widget
             
             # Input widget
-            if dtype == bool:
-                var = tk.BooleanVar()
-                widget = ttk.Checkbutton(middle_panel, variable=var)
-            elif dtype == int:
-                var = tk.StringVar()
-                widget = ttk.Entry(middle_panel, textvariable=var, width=20)
-            else:
-                var = tk.StringVar()
-                widget = ttk.Entry(middle_panel, textvariable=var, width=20)
+            var_cls, widget_cls, var_option, widget_options = self._PROPERTY_WIDGETS[dtype]
+            var = var_cls()
+            widget = widget_cls(middle_panel, **{var_option: var}, **widget_options)
             
             widget.grid(row=row, column=1, sticky=(tk.W, tk.E), pady=5)
             self.prop_vars[key] = (var, dtype)
             self.prop_widgets[key] = widget
             
-            # Add auto-save on field change
-            if dtype == bool:
-                var.trace_add("write", lambda *args, k=key: self._on_property_change(k))
-            else:
-                var.trace_add("write", lambda *args, k=key: self._on_property_change(k))
+            # Add auto-save on field change (the trace passes its Tcl args straight through)
+            var.trace_add("write", partial(self._on_property_change, key))
             
             row += 1
         
+        # Split fields by how load_object_to_form fills them (int and str are both text entries)
+        self._bool_props = [(key, var) for key, (var, dtype) in self.prop_vars.items() if dtype == bool]
+        self._text_props = [(key, var) for key, (var, dtype) in self.prop_vars.items() if dtype != bool]
+        
+        # Precompute which properties each object type shows (all widgets start visible)
+        object_types = ["tile", "character", "goal", "consumable", "chest"]
+        self._visible_by_type = {}
+        for obj_type in object_types:
+            self._get_visible_properties(obj_type)
+        self._visible_props = frozenset(self.property_schema)
+        
         # Type dropdown - special handling (replace the Entry widget with Combobox)
         # Remove the Entry widget that was created for object_type
         if "object_type" in self.prop_widgets:
             self.prop_widgets["object_type"].grid_remove()
         type_combo = ttk.Combobox(middle_panel, textvariable=self.prop_vars["object_type"][0], 
-                                  values=["tile", "character", "goal", "consumable", "chest"], width=17)
+                                  values=object_types, width=17)
         type_combo.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5)
         type_combo.bind("<<ComboboxSelected>>", lambda e: self._on_object_type_changed())
         # Update the widget reference to point to the Combobox
@@ -261,6 +508,8 @@ class GameObjectEditor:
         self.sprite_listbox = tk.Listbox(sprite_list_frame, yscrollcommand=sprite_scrollbar.set, 
                                          height=4, width=30)
         self.sprite_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # (x, y) for each listbox row, kept in step so rows never need parsing back
+        self._sprite_coords = []
         sprite_scrollbar.config(command=self.sprite_listbox.yview)
         
         # Sprite list buttons
@@ -288,74 +537,6 @@ class GameObjectEditor:
                               text="Use the main 'Sprites' list above. First sprite = closed, second sprite = open.",
                               font=("Arial", 8), foreground="gray", wraplength=300)
         info_label.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(10, 5))
-        
-        # Custom properties removed - all properties are now defined in schema
-        
-        # Note: Save is now handled by the main "Save" button at the bottom
-        
-        # Store last clicked coordinates for adding sprites
-        self.last_clicked_sprite = None
-        
-        # Right panel - Sprite preview
-        right_panel = ttk.LabelFrame(self.objects_tab, text="Sprite Preview", padding="10")
-        right_panel.grid(row=0, column=2, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Canvas with scrollbars
-        canvas_frame = ttk.Frame(right_panel)
-        canvas_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Scrollbars
-        v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL)
-        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        h_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL)
-        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
-        
-        self.sprite_canvas = tk.Canvas(canvas_frame, width=400, height=400, bg="gray",
-                                       yscrollcommand=v_scrollbar.set,
-                                       xscrollcommand=h_scrollbar.set)
-        self.sprite_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        v_scrollbar.config(command=self.sprite_canvas.yview)
-        h_scrollbar.config(command=self.sprite_canvas.xview)
-        
-        # Sprite sheet selection
-        sheet_frame = ttk.Frame(right_panel)
-        sheet_frame.pack(fill=tk.X, pady=(10, 0))
-        ttk.Label(sheet_frame, text="Sprite Sheet:").pack(side=tk.LEFT, padx=(0, 5))
-        self.sprite_sheet_var = tk.StringVar()
-        self.sprite_sheet_combo = ttk.Combobox(sheet_frame, textvariable=self.sprite_sheet_var, 
-                                                state="readonly", width=30)
-        self.sprite_sheet_combo.pack(side=tk.LEFT, padx=(0, 5))
-        self.sprite_sheet_combo.bind("<<ComboboxSelected>>", self.on_sprite_sheet_change)
-        ttk.Button(sheet_frame, text="Refresh", command=self.refresh_sprite_sheets, width=8).pack(side=tk.LEFT)
-        
-        # Sprite sheet navigation and zoom controls
-        nav_frame = ttk.Frame(right_panel)
-        nav_frame.pack(fill=tk.X, pady=(10, 0))
-        ttk.Label(nav_frame, text="Click on sprite sheet to set coordinates").pack()
-        
-        # Zoom controls
-        zoom_frame = ttk.Frame(nav_frame)
-        zoom_frame.pack(pady=(5, 0))
-        ttk.Button(zoom_frame, text="Zoom In (+)", command=self.zoom_in, width=12).pack(side=tk.LEFT, padx=2)
-        ttk.Button(zoom_frame, text="Zoom Out (-)", command=self.zoom_out, width=12).pack(side=tk.LEFT, padx=2)
-        ttk.Button(zoom_frame, text="Reset (1x)", command=self.zoom_reset, width=12).pack(side=tk.LEFT, padx=2)
-        self.zoom_label = ttk.Label(zoom_frame, text="Zoom: 100%")
-        self.zoom_label.pack(side=tk.LEFT, padx=(10, 0))
-        
-        self.sprite_canvas.bind("<Button-1>", self.on_sprite_click)
-        # Mouse wheel support (different on different platforms)
-        self.sprite_canvas.bind("<MouseWheel>", self.on_mousewheel)  # Windows/Linux
-        self.sprite_canvas.bind("<Button-4>", lambda e: self.zoom_in())  # macOS scroll up
-        self.sprite_canvas.bind("<Button-5>", lambda e: self.zoom_out())  # macOS scroll down
-        # Make canvas focusable for mouse wheel
-        self.sprite_canvas.bind("<Enter>", lambda e: self.sprite_canvas.focus_set())
-        self.sprite_canvas.bind("<Leave>", lambda e: self.root.focus_set())
-        
-        # Configure grid weights for objects tab
-        self.objects_tab.columnconfigure(1, weight=1)
-        self.objects_tab.rowconfigure(0, weight=1)
     
     def log_status(self, message, level="info"):
         """Log a status message to the status label"""
@@ -392,18 +573,31 @@ class GameObjectEditor:
         # Update property visibility
         self._update_property_visibility(obj_type)
     
+    def _get_visible_properties(self, obj_type):
+        """Return the set of property keys shown for an object type (memoized)"""
+        visible = self._visible_by_type.get(obj_type)
+        if visible is None:
+            visible = frozenset(
+                key for key, (label, prop_key, dtype, always_show, show_for_types) in self.property_schema.items()
+                if always_show or obj_type in show_for_types
+            )
+            self._visible_by_type[obj_type] = visible
+        return visible
+    
     def _update_property_visibility(self, obj_type):
         """Show/hide properties based on object type"""
-        for key, (label, prop_key, dtype, always_show, show_for_types) in self.property_schema.items():
-            should_show = always_show or (obj_type in show_for_types)
-            
+        visible = self._get_visible_properties(obj_type)
+        
+        # Only toggle widgets whose visibility changes - every grid call triggers a re-layout
+        for key in self._visible_props - visible:
             if key in self.prop_labels and key in self.prop_widgets:
-                if should_show:
-                    self.prop_labels[key].grid()
-                    self.prop_widgets[key].grid()
-                else:
-                    self.prop_labels[key].grid_remove()
-                    self.prop_widgets[key].grid_remove()
+                self.prop_labels[key].grid_remove()
+                self.prop_widgets[key].grid_remove()
+        for key in visible - self._visible_props:
+            if key in self.prop_labels and key in self.prop_widgets:
+                self.prop_labels[key].grid()
+                self.prop_widgets[key].grid()
+        self._visible_props = visible
         
         # Show/hide interactable frame based on object type
         if obj_type == "chest":
@@ -411,21 +605,37 @@ class GameObjectEditor:
         else:
             self.interactable_frame.grid_remove()
     
-    def _on_property_change(self, key):
+    def _on_property_change(self, key, *tcl_args):
         """Handle property change - auto-save after a short delay"""
         if not self.current_object:
             return
         # Don't auto-save when loading object into form (would cause infinite loop)
         if hasattr(self, '_loading_object') and self._loading_object:
             return
+        # Programmatic var.set() with the stored value is not an edit
+        if self._property_matches_object(key):
+            return
         # Debounce: cancel previous auto-save and schedule a new one
-        if hasattr(self, '_auto_save_job'):
+        if self._auto_save_job is not None:
             self.root.after_cancel(self._auto_save_job)
         # Auto-save after 500ms of no changes
         self._auto_save_job = self.root.after(500, self._auto_save_object)
     
+    def _property_matches_object(self, key):
+        """Check whether a form field already shows the value stored on the current object"""
+        var, dtype = self.prop_vars[key]
+        stored = self.current_object.get(key)
+        try:
+            value = var.get()
+        except tk.TclError:
+            return False
+        if dtype == bool:
+            return stored is not None and bool(stored) == value
+        return ("" if stored is None else str(stored)) == value
+    
     def _auto_save_object(self):
         """Auto-save current object changes"""
+        self._auto_save_job = None
         if self.current_object:
             try:
                 self._save_current_object_changes()
@@ -435,6 +645,7 @@ class GameObjectEditor:
     
     def load_config(self):
         """Load game config from TOML file"""
+        self._objects_version += 1
         if not self.config_path.exists():
             self.log_status(f"Config file not found. Creating default config.", "warning")
             self.config = {"game_objects": [], "levels": []}
@@ -442,8 +653,11 @@ class GameObjectEditor:
             return
         
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = toml.load(f)
+            self.config = _read_toml(self.config_path)
+            self._valid_objects.clear()
+            # The file already holds this content - a save with no edits can skip the write
+            self._last_saved_hash = _snapshot_digest(pickle.dumps(self.config, pickle.HIGHEST_PROTOCOL))
+            self._normalize_legacy_sprites()
             
             # Check if config is empty or has no game_objects
             if not self.config or "game_objects" not in self.config or len(self.config.get("game_objects", [])) == 0:
@@ -461,6 +675,8 @@ class GameObjectEditor:
             if "levels" not in self.config:
                 self.config["levels"] = []
             
+            self._display_cache = None
+            self._objects_dirty = True
             self.refresh_object_list()
             # Refresh tile palette if UI is already created
             if hasattr(self, 'tile_palette_listbox'):
@@ -475,39 +691,108 @@ class GameObjectEditor:
             self.config = {"game_objects": []}
     
     def load_schema(self):
-        """Load GameObject schema from server endpoint or use defaults"""
+        """Load GameObject schema from the local file, fetching it from the server in the background if missing"""
+        if not self._load_schema_local():
+            # No local copy - build the UI from the defaults and swap in the server schema when it arrives
+            self.schema = self._get_default_schema()
+            self._schema_fetch_queue = queue.Queue()
+            threading.Thread(target=self._fetch_schema_remote, daemon=True).start()
+            self.root.after(100, self._poll_schema_fetch)
+        self._compiled_schema = self._compile_schema(self.schema)
+    
+    def _load_schema_local(self):
+        """Load the schema from game_object_schema.json. Returns True on success"""
+        schema_path = self.project_root / "game_object_schema.json"
+        if not schema_path.exists():
+            return False
+        try:
+            with open(schema_path, 'rb') as f:
+                self.schema = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Failed to load schema from file: {e}")
+            return False
+        if not hasattr(self, 'status_label') or not self.status_label:
+            print("Loaded schema from local file")
+        else:
+            self.log_status("Loaded schema from local file", "success")
+        return True
+    
+    def _fetch_schema_remote(self):
+        """Worker thread: download the schema and cache it locally. Must not touch Tk"""
+        import urllib.request
         schema_path = self.project_root / "game_object_schema.json"
-        
-        # Try to load from local file first
-        if schema_path.exists():
-            try:
-                with open(schema_path, 'r') as f:
-                    self.schema = json.load(f)
-                if not hasattr(self, 'status_label') or not self.status_label:
-                    print("Loaded schema from local file")
-                else:
-                    self.log_status("Loaded schema from local file", "success")
-                return
-            except Exception as e:
-                if hasattr(self, 'status_label') and self.status_label:
-                    self.log_status(f"Failed to load schema from file: {e}", "warning")
-        
-        # Try to fetch from server
         try:
             url = "http://localhost:3000/api/schema"
             with urllib.request.urlopen(url, timeout=2) as response:
-                self.schema = json.loads(response.read().decode())
-                # Save to local file for offline use
-                with open(schema_path, 'w') as f:
-                    json.dump(self.schema, f, indent=2)
-                if hasattr(self, 'status_label') and self.status_label:
-                    self.log_status("Loaded schema from server", "success")
-                return
-        except (urllib.error.URLError, urllib.error.HTTPError, OSError) as e:
-            # Server not running or endpoint not available - use hardcoded fallback
-            if hasattr(self, 'status_label') and self.status_label:
-                self.log_status("Server not available, using default schema", "warning")
-            self.schema = self._get_default_schema()
+                # json.loads accepts UTF-8 bytes directly - no intermediate str copy
+                raw = response.read()
+            schema = json.loads(raw)
+            # Save the payload as received for offline use (no re-serialization)
+            schema_path.write_bytes(raw)
+            self._schema_fetch_queue.put((schema, None))
+        except (urllib.error.URLError, urllib.error.HTTPError, OSError, ValueError) as e:
+            self._schema_fetch_queue.put((None, e))
+    
+    def _poll_schema_fetch(self):
+        """Apply the server schema once the fetch thread has finished"""
+        try:
+            schema, error = self._schema_fetch_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(100, self._poll_schema_fetch)
+            return
+        
+        if error is not None:
+            # Server not running or endpoint not available - keep the hardcoded fallback
+            self.log_status("Server not available, using default schema", "warning")
+            return
+        
+        self.log_status("Loaded schema from server", "success")
+        if schema != self.schema:
+            self._apply_schema(schema)
+    
+    def _apply_schema(self, schema):
+        """Replace the schema and rebuild the property panel to match"""
+        # Apply a debounced edit now - the form vars it reads are about to be replaced
+        if self._auto_save_job is not None:
+            self.root.after_cancel(self._auto_save_job)
+            self._auto_save_object()
+        self.schema = schema
+        self._compiled_schema = self._compile_schema(schema)
+        for child in self.middle_panel.winfo_children():
+            child.destroy()
+        self._build_property_panel(self.middle_panel)
+        self.refresh_sprite_sheets()  # Repopulate the new sprite sheet dropdown
+        if self.current_object:
+            self.load_object_to_form()
+    
+    def _compile_schema(self, schema):
+        """Convert schema fields into the read-only property mapping used by the form
+        
+        Returns:
+            Mapping of field name to (label, field name, dtype, always_show, show_for_types)
+        """
+        property_schema = {}
+        # Filter out hidden fields (label=None)
+        for field in (schema or {}).get("fields", []):
+            label = field.get("label")
+            if label is None:  # Skip hidden fields
+                continue
+            
+            field_name = field["name"]
+            field_type = field["field_type"]
+            show_for_types = field.get("show_for_types", [])
+            
+            # Map Rust types to Python types
+            if field_type == "bool" or field_type == "Option<bool>":
+                dtype = bool
+            elif "i32" in field_type or "u32" in field_type:
+                dtype = int
+            else:
+                dtype = str
+            
+            # Empty show_for_types means show for all
+            property_schema[field_name] = (f"{label}:", field_name, dtype, not show_for_types, show_for_types)
+        return MappingProxyType(property_schema)
     
     def _get_default_schema(self):
         """Fallback schema if server is not available"""
@@ -573,41 +858,70 @@ class GameObjectEditor:
             ]
         }
     
-    def validate_config(self):
-        """Validate all game objects against the required schema
+    def _get_validation_schema(self):
+        """Required-field schema prepared for validation, built once per process
         
-        Shows a dialog forcing user to fix missing required parameters before continuing.
+        Returns:
+            tuple: (required_fields, required_set, type_specific) where required_fields
+                excludes 'sprites' (checked separately) and type_specific maps
+                object_type to a tuple of fields
         """
-        if not self.config or "game_objects" not in self.config:
-            return
-        
-        schema = self.get_required_schema()
-        required_fields = schema['required_fields']
-        type_specific = schema['type_specific']
+        if self._validation_schema is None:
+            schema = self.get_required_schema()
+            required_fields = tuple(field for field in schema['required_fields'] if field != 'sprites')
+            type_specific = {obj_type: tuple(fields) for obj_type, fields in schema['type_specific'].items()}
+            self._validation_schema = (required_fields, frozenset(required_fields), type_specific)
+        return self._validation_schema
+    
+    def _find_schema_issues(self):
+        """Check all game objects for missing required fields
         
-        issues = []  # List of (object_index, object_id, object_name, missing_fields)
+        Returns:
+            list: (object_index, object_id, object_name, missing_fields) per failing object
+        """
+        required_fields, required_set, type_specific = self._get_validation_schema()
+        valid_objects = self._valid_objects
         
+        issues = []
         for idx, obj in enumerate(self.config.get("game_objects", [])):
-            missing_fields = []
-            obj_type = obj.get("object_type", "unknown")
+            # Unedited objects that passed last time can't have gained missing fields
+            if valid_objects.get(id(obj)) is obj:
+                continue
+            get = obj.get
+            type_fields = type_specific.get(get("object_type", "unknown"), ())
             
-            # Check required fields (always required)
-            for field in required_fields:
-                if field == 'sprites':
-                    # sprites must exist as a list (can be empty)
-                    if 'sprites' not in obj or not isinstance(obj.get('sprites'), list):
-                        missing_fields.append('sprites')
-                elif field not in obj:
-                    missing_fields.append(field)
+            # Fast path: a complete object allocates nothing
+            if (required_set <= obj.keys() and isinstance(get('sprites'), list)
+                    and all(get(field) is not None for field in type_fields)):
+                valid_objects[id(obj)] = obj
+                continue
+            
+            # Check required fields (always required) - one set difference per object,
+            # reported in schema order
+            missing = required_set - obj.keys()
+            missing_fields = [field for field in required_fields if field in missing] if missing else []
+            
+            # sprites must exist as a list (can be empty)
+            if not isinstance(get('sprites'), list):
+                missing_fields.append('sprites')
             
             # Check type-specific required fields
-            if obj_type in type_specific:
-                for field in type_specific[obj_type]:
-                    if field not in obj or obj[field] is None:
-                        missing_fields.append(field)
+            for field in type_fields:
+                if get(field) is None:
+                    missing_fields.append(field)
             
-            if missing_fields:
-                issues.append((idx, obj.get('id', f'object_{idx}'), obj.get('name', 'Unnamed'), missing_fields))
+            issues.append((idx, get('id', f'object_{idx}'), get('name', 'Unnamed'), missing_fields))
+        return issues
+    
+    def validate_config(self):
+        """Validate all game objects against the required schema
+        
+        Shows a dialog forcing user to fix missing required parameters before continuing.
+        """
+        if not self.config or "game_objects" not in self.config:
+            return
+        
+        issues = self._find_schema_issues()
         
         if issues:
             # Show validation dialog
@@ -645,41 +959,42 @@ class GameObjectEditor:
         list_frame = ttk.Frame(dialog, padding="10")
         list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Scrollable list
+        # Scrollable table: one row per object, missing fields in a column
         scrollbar = ttk.Scrollbar(list_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar.set, font=("Courier", 9))
-        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=listbox.yview)
+        tree = ttk.Treeview(list_frame, columns=("missing",), show="tree headings",
+                            yscrollcommand=scrollbar.set)
+        tree.heading("#0", text="Object")
+        tree.heading("missing", text="Missing")
+        tree.column("#0", width=280)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=tree.yview)
         
-        # Populate list
+        # Populate table - the row id is the object's index in game_objects
         for idx, obj_id, obj_name, missing_fields in issues:
-            obj_display = f"[{obj_id}] {obj_name}"
-            missing_str = ", ".join(missing_fields)
-            listbox.insert(tk.END, f"{obj_display}")
-            listbox.insert(tk.END, f"  Missing: {missing_str}")
-            listbox.insert(tk.END, "")  # Empty line
+            tree.insert("", tk.END, iid=str(idx), text=f"[{obj_id}] {obj_name}",
+                        values=(", ".join(missing_fields),))
         
         # Buttons
         button_frame = ttk.Frame(dialog, padding="10")
         button_frame.pack(fill=tk.X)
         
         def go_to_object(event=None):
-            selection = listbox.curselection()
-            if selection:
-                # Find which object this corresponds to
-                line_idx = selection[0]
-                # Each object takes 3 lines (name, missing, empty)
-                obj_idx = line_idx // 3
-                if obj_idx < len(issues):
-                    actual_obj_idx = issues[obj_idx][0]
-                    # Select the object in the main list
-                    self.object_listbox.selection_clear(0, tk.END)
-                    self.object_listbox.selection_set(actual_obj_idx)
-                    self.object_listbox.see(actual_obj_idx)
-                    self.on_object_select(None)
-                    dialog.destroy()
+            focused = tree.focus()
+            if focused:
+                actual_obj_idx = int(focused)
+                if actual_obj_idx not in self._visible_indices:
+                    # Hidden by the filter - clear it so the object has a row
+                    self.filter_var.set("")
+                    self.filter_objects()
+                row = self._visible_indices.index(actual_obj_idx)
+                # Select the object in the main list
+                self.object_listbox.selection_clear(0, tk.END)
+                self.object_listbox.selection_set(row)
+                self.object_listbox.see(row)
+                self.on_object_select(None)
+                dialog.destroy()
         
         def fix_all():
             """Try to fix all issues with default values"""
@@ -689,18 +1004,14 @@ class GameObjectEditor:
                 obj_type = obj.get("object_type", "unknown")
                 
                 for field in missing_fields:
-                    if field == 'sprites':
-                        obj['sprites'] = []
-                        # Try to create from legacy sprite_x/sprite_y if available
-                        if 'sprite_x' in obj and 'sprite_y' in obj:
-                            obj['sprites'] = [{"x": obj['sprite_x'], "y": obj['sprite_y']}]
+                    factory = (_DEFAULT_FACTORIES.get((obj_type, field))
+                               or _DEFAULT_FACTORIES.get((None, field)))
+                    if factory is not None:
+                        obj[field] = factory(obj)
                         fixed_count += 1
-                    elif field == 'healing_power' and obj_type == 'consumable':
-                        obj['healing_power'] = 20  # Default healing power
-                        fixed_count += 1
-                    # Add more default values as needed
             
             if fixed_count > 0:
+                self._objects_version += 1
                 self.log_status(f"Auto-fixed {fixed_count} missing fields with defaults", "success")
                 self.save_config()
                 dialog.destroy()
@@ -714,10 +1025,10 @@ class GameObjectEditor:
         ttk.Button(button_frame, text="Close (I'll fix manually)", command=dialog.destroy).pack(side=tk.RIGHT, padx=5)
         
         # Double-click to go to object
-        listbox.bind('<Double-Button-1>', go_to_object)
+        tree.bind('<Double-Button-1>', go_to_object)
         
-        # Focus on listbox
-        listbox.focus_set()
+        # Focus on the table
+        tree.focus_set()
     
     def create_default_objects(self):
         """Create default game objects"""
@@ -790,17 +1101,21 @@ class GameObjectEditor:
                 }
             ]
         }
+        self._normalize_legacy_sprites()
+    
+    def _normalize_legacy_sprites(self):
+        """Migrate legacy sprite_x/sprite_y fields into the sprites array, once at load"""
+        for obj in self.config.get("game_objects", []):
+            if not obj.get("sprites"):
+                if obj.get("sprite_x") is None or obj.get("sprite_y") is None:
+                    continue  # Nothing usable to migrate
+                obj["sprites"] = [{"x": obj["sprite_x"], "y": obj["sprite_y"]}]
+            obj.pop("sprite_x", None)
+            obj.pop("sprite_y", None)
     
     def refresh_sprite_sheets(self):
         """Refresh the list of available sprite sheets"""
-        sprite_sheets = []
-        if self.assets_dir.exists():
-            # Find all PNG files in assets directory
-            for file in self.assets_dir.glob("*.png"):
-                sprite_sheets.append(file.name)
-        
-        # Sort alphabetically
-        sprite_sheets.sort()
+        sprite_sheets = self._list_sprite_sheets()
         
         # Update preview combobox
         if hasattr(self, 'sprite_sheet_combo'):
@@ -820,6 +1135,17 @@ class GameObjectEditor:
         if hasattr(self, 'sprite_sheet_prop_combo'):
             self.sprite_sheet_prop_combo['values'] = sprite_sheets
     
+    def _list_sprite_sheets(self):
+        """Sorted PNG names in the assets directory, rescanned only when the directory changes"""
+        try:
+            mtime = self.assets_dir.stat().st_mtime_ns
+        except OSError:
+            return []
+        if self._sheets_cache is None or self._sheets_cache[0] != mtime:
+            # Find all PNG files in assets directory, sorted alphabetically
+            self._sheets_cache = (mtime, sorted(file.name for file in self.assets_dir.glob("*.png")))
+        return list(self._sheets_cache[1])
+    
     def on_sprite_sheet_change(self, event=None):
         """Handle sprite sheet selection change"""
         new_sheet = self.sprite_sheet_var.get()
@@ -847,8 +1173,10 @@ class GameObjectEditor:
             return
         
         try:
-            # Load original image (don't resize)
-            self.original_sprite_image = Image.open(self.sprite_sheet_path)
+            # Load original image (don't resize) - decoded once per file version
+            self._sprite_sheet_mtime = self.sprite_sheet_path.stat().st_mtime
+            self.original_sprite_image = _load_sprite_sheet_image(
+                str(self.sprite_sheet_path), self._sprite_sheet_mtime)
             self.zoom_level = 1.0
             self.update_sprite_display()
             self.log_status(f"Loaded sprite sheet: {self.current_sprite_sheet}", "success")
@@ -860,27 +1188,41 @@ class GameObjectEditor:
         if not self.original_sprite_image:
             return
         
-        # Calculate new size based on zoom
-        new_width = int(self.original_sprite_image.width * self.zoom_level)
-        new_height = int(self.original_sprite_image.height * self.zoom_level)
-        
-        # Resize image
-        self.sprite_sheet_image = self.original_sprite_image.resize(
-            (new_width, new_height), 
-            Image.Resampling.LANCZOS
-        )
-        self.sprite_sheet_photo = ImageTk.PhotoImage(self.sprite_sheet_image)
+        # Resize image (cached per zoom level, so zooming back and forth is cheap)
+        self.sprite_sheet_image = _resize_sprite_sheet_image(
+            str(self.sprite_sheet_path), self._sprite_sheet_mtime, self.zoom_level)
         
-        # Clear canvas and redraw
-        self.sprite_canvas.delete("all")
-        self.sprite_canvas.create_image(0, 0, anchor=tk.NW, image=self.sprite_sheet_photo)
-        self.sprite_canvas.config(scrollregion=self.sprite_canvas.bbox("all"))
+        photo = self.sprite_sheet_photo
+        if (photo is not None and self._sheet_item_id is not None
+                and (photo.width(), photo.height()) == self.sprite_sheet_image.size):
+            # Same size (e.g. reload or a same-sized sheet): update the Tk image's pixels in place
+            photo.paste(self.sprite_sheet_image)
+        else:
+            self.sprite_sheet_photo = ImageTk.PhotoImage(self.sprite_sheet_image)
+            # Swap the image on the persistent canvas item instead of recreating it
+            if self._sheet_item_id is None:
+                self._sheet_item_id = self.sprite_canvas.create_image(
+                    0, 0, anchor=tk.NW, image=self.sprite_sheet_photo)
+            else:
+                self.sprite_canvas.itemconfigure(self._sheet_item_id, image=self.sprite_sheet_photo)
+        self.sprite_canvas.config(
+            scrollregion=(0, 0, self.sprite_sheet_image.width, self.sprite_sheet_image.height))
         
         # Update zoom label
         self.zoom_label.config(text=f"Zoom: {int(self.zoom_level * 100)}%")
         
-        # Redraw highlight if object is selected and uses this sprite sheet
-        if self.current_object:
+        # Rescale the existing highlight overlay on zoom, otherwise redraw it
+        # if object is selected and uses this sprite sheet
+        previous_zoom = self._displayed_zoom
+        self._displayed_zoom = self.zoom_level
+        if previous_zoom and self.sprite_canvas.find_withtag("highlight"):
+            factor = self.zoom_level / previous_zoom
+            self.sprite_canvas.scale("highlight", 0, 0, factor, factor)
+            self.sprite_canvas.itemconfigure("highlight", width=max(2, int(2 * self.zoom_level)))
+            if self._last_highlight_key:
+                sheet, _, coords = self._last_highlight_key
+                self._last_highlight_key = (sheet, self.zoom_level, coords)
+        elif self.current_object:
             self.highlight_sprite()  # highlight_sprite now checks sprite sheet match internally
     
     def zoom_in(self):
@@ -905,42 +1247,70 @@ class GameObjectEditor:
         else:
             self.zoom_out()
     
-    # Map zoom methods
-    def _find_tile_id_by_properties(self, tile_data):
-        """Update the map zoom label"""
-        if hasattr(self, 'map_zoom_label'):
-            self.map_zoom_label.config(text=f"Zoom: {int(self.map_zoom_level * 100)}%")
-    
     def refresh_object_list(self, preserve_selection=False):
         """Refresh the object listbox
         
         Args:
             preserve_selection: If True, restore the selection after refresh
         """
+        # Nothing to redraw if no object was added, removed or renamed and the filter is the same
+        filter_text = self.filter_var.get().lower()
+        if not self._objects_dirty and filter_text == self._list_filter_snapshot:
+            return
+        self._objects_dirty = False
+        self._list_filter_snapshot = filter_text
+        
         # Save current selection if preserving
         selected_id = None
         if preserve_selection and self.current_object:
             selected_id = self.current_object.get("id")
         
-        self.object_listbox.delete(0, tk.END)
+        self.object_listbox.selection_clear(0, tk.END)
+        self._visible_indices = []
         if not self.config or "game_objects" not in self.config:
+            self._object_list_var.set(())
             return
         
-        filter_text = self.filter_var.get().lower()
-        for idx, obj in enumerate(self.config["game_objects"]):
-            name = obj.get("name", obj.get("id", "Unknown"))
-            obj_type = obj.get("object_type", "unknown")
-            display_text = f"{name} ({obj_type})"
-            if filter_text == "" or filter_text in display_text.lower():
-                listbox_idx = self.object_listbox.size()
-                self.object_listbox.insert(tk.END, display_text)
-                # Restore selection if this is the selected object
+        display_cache = self._get_display_cache()
+        display_texts = []
+        selected_idx = None
+        for actual_idx, (obj, (display, display_lower)) in enumerate(zip(self.config["game_objects"], display_cache)):
+            if not filter_text or filter_text in display_lower:
+                # Remember where the selected object lands so it can be restored
                 if preserve_selection and selected_id and obj.get("id") == selected_id:
-                    self.object_listbox.selection_set(listbox_idx)
-                    self.object_listbox.see(listbox_idx)
+                    selected_idx = len(display_texts)
+                display_texts.append(display)
+                self._visible_indices.append(actual_idx)  # Row -> index in game_objects
+        
+        # Replace all rows in a single Tcl call
+        self._object_list_var.set(tuple(display_texts))
+        if selected_idx is not None:
+            self.object_listbox.selection_set(selected_idx)
+            self.object_listbox.see(selected_idx)
+    
+    def _get_display_cache(self):
+        """Return (list text, lowercased list text) per object, rebuilding it if invalidated"""
+        if self._display_cache is None:
+            self._display_cache = [self._object_display(obj) for obj in self.config.get("game_objects", [])]
+        return self._display_cache
+    
+    def _object_display(self, obj):
+        """(list text, lowercased list text) for one object"""
+        display = f"{obj.get('name', obj.get('id', 'Unknown'))} ({obj.get('object_type', 'unknown')})"
+        return display, display.lower()
+    
+    def _schedule_filter(self, *args):
+        """Debounce filter typing so the list is rebuilt once per pause, not per keystroke"""
+        if self._filter_job:
+            self.root.after_cancel(self._filter_job)
+        self._filter_job = self.root.after(150, self.filter_objects)
     
     def filter_objects(self, *args):
         """Filter objects based on search text"""
+        if self._filter_job is not None:
+            # Called directly (e.g. right after filter_var.set) - the debounced run is redundant
+            self.root.after_cancel(self._filter_job)
+            self._filter_job = None
         self.refresh_object_list()
     
     def on_object_select(self, event):
@@ -949,22 +1319,15 @@ class GameObjectEditor:
         if not selection:
             return
         
+        # Map the row back to the config index recorded by refresh_object_list
         idx = selection[0]
-        filter_text = self.filter_var.get().lower()
-        
-        # Find actual index in config
-        if filter_text:
-            filtered = [i for i, obj in enumerate(self.config["game_objects"])
-                       if filter_text in f"{obj.get('name', obj.get('id', ''))} ({obj.get('object_type', '')})".lower()]
-            if idx < len(filtered):
-                actual_idx = filtered[idx]
-            else:
-                return
-        else:
-            actual_idx = idx
+        if idx >= len(self._visible_indices):
+            return
+        actual_idx = self._visible_indices[idx]
         
         if actual_idx < len(self.config["game_objects"]):
             self.current_object = self.config["game_objects"][actual_idx]
+            self.current_object_idx = actual_idx
             # Switch to object's sprite sheet if specified
             obj_sprite_sheet = self.current_object.get("sprite_sheet")
             if obj_sprite_sheet and obj_sprite_sheet != self.current_sprite_sheet:
@@ -988,33 +1351,19 @@ class GameObjectEditor:
         obj_type = obj.get("object_type", "tile")
         self._update_property_visibility(obj_type)
         
-        # Set standard properties
-        for key, (var, dtype) in self.prop_vars.items():
-            if key in obj:
-                if dtype == bool:
-                    var.set(obj[key])
-                elif dtype == int:
-                    var.set(str(obj.get(key, "")))
-                else:
-                    # For string fields like sprite_sheet, preserve the value
-                    var.set(str(obj.get(key, "")))
-            else:
-                if dtype == bool:
-                    # For monster checkbox, check both top-level and properties map as fallback
-                    if key == "monster":
-                        # Check both top-level and properties map
-                        monster_val = obj.get("monster")
-                        if monster_val is None:
-                            monster_val = obj.get("properties", {}).get("monster", False)
-                            # Handle string "true"/"false" from properties
-                            if isinstance(monster_val, str):
-                                monster_val = monster_val.lower() == "true"
-                        var.set(bool(monster_val))
-                    else:
-                        var.set(False)
-                else:
-                    # Don't clear string fields - they might have values we want to preserve
-                    var.set("")
+        # Set standard properties (partitioned by dtype when the panel was built)
+        for key, var in self._bool_props:
+            var.set(obj[key] if key in obj else False)
+        for key, var in self._text_props:
+            var.set(str(obj[key]) if key in obj else "")
+        
+        # For monster checkbox, fall back to the properties map if there's no top-level value
+        if "monster" not in obj and self.prop_vars.get("monster", (None, None))[1] == bool:
+            monster_val = obj.get("properties", {}).get("monster", False)
+            # Handle string "true"/"false" from properties
+            if isinstance(monster_val, str):
+                monster_val = monster_val.lower() == "true"
+            self.prop_vars["monster"][0].set(bool(monster_val))
         
         # Handle health (can be None)
         health = obj.get("health")
@@ -1024,19 +1373,14 @@ class GameObjectEditor:
             self.prop_vars["health"][0].set(str(health))
         
         # Load sprite array
+        self._sprite_coords = [
+            (sprite.get("x", 0), sprite.get("y", 0)) if isinstance(sprite, dict)
+            else (getattr(sprite, 'x', 0), getattr(sprite, 'y', 0))
+            for sprite in obj.get("sprites", [])
+        ]
         self.sprite_listbox.delete(0, tk.END)
-        sprites = obj.get("sprites", [])
-        # If no sprites array, check for legacy sprite_x/sprite_y
-        if not sprites:
-            sprite_x = obj.get("sprite_x")
-            sprite_y = obj.get("sprite_y")
-            if sprite_x is not None and sprite_y is not None:
-                sprites = [{"x": sprite_x, "y": sprite_y}]
-        
-        for sprite in sprites:
-            x = sprite.get("x", 0) if isinstance(sprite, dict) else sprite.x if hasattr(sprite, 'x') else 0
-            y = sprite.get("y", 0) if isinstance(sprite, dict) else sprite.y if hasattr(sprite, 'y') else 0
-            self.sprite_listbox.insert(tk.END, f"({x}, {y})")
+        if self._sprite_coords:
+            self.sprite_listbox.insert(tk.END, *(f"({x}, {y})" for x, y in self._sprite_coords))
         
         # Load interactable data
         self._load_interactable_data(obj)
@@ -1055,7 +1399,7 @@ class GameObjectEditor:
         
         if self.last_clicked_sprite:
             x, y = self.last_clicked_sprite
-            self.sprite_listbox.insert(tk.END, f"({x}, {y})")
+            self._append_sprite_row(x, y)
             self.last_clicked_sprite = None
             # Auto-save after adding sprite
             if self.current_object:
@@ -1078,7 +1422,7 @@ class GameObjectEditor:
                 try:
                     x = int(x_var.get())
                     y = int(y_var.get())
-                    self.sprite_listbox.insert(tk.END, f"({x}, {y})")
+                    self._append_sprite_row(x, y)
                     dialog.destroy()
                     # Auto-save after adding sprite
                     if self.current_object:
@@ -1088,38 +1432,25 @@ class GameObjectEditor:
             
             ttk.Button(dialog, text="Add", command=add_sprite).grid(row=2, column=0, columnspan=2, pady=10)
     
+    def _append_sprite_row(self, x, y):
+        """Add a sprite row to the listbox and its coordinate list"""
+        self._sprite_coords.append((x, y))
+        self.sprite_listbox.insert(tk.END, f"({x}, {y})")
+    
     def remove_sprite(self):
         """Remove selected sprite from list"""
         selection = self.sprite_listbox.curselection()
         if selection:
             index = selection[0]
             self.sprite_listbox.delete(index)
-            # Update the object's sprites array immediately from listbox
+            del self._sprite_coords[index]
+            # Update the object's sprites array immediately
             if self.current_object:
-                # Set flag to prevent auto-save from reloading form
-                self._loading_object = True
-                # Update sprites array from listbox
-                sprites = []
-                for i in range(self.sprite_listbox.size()):
-                    text = self.sprite_listbox.get(i)
-                    # Parse "(x, y)" format
-                    import re
-                    match = re.match(r'\((\d+),\s*(\d+)\)', text)
-                    if match:
-                        sprites.append({"x": int(match.group(1)), "y": int(match.group(2))})
-                # Update the object's sprites array directly
-                self.current_object["sprites"] = sprites
-                # Remove legacy fields if sprites array exists
-                if sprites and len(sprites) > 0:
-                    self.current_object.pop("sprite_x", None)
-                    self.current_object.pop("sprite_y", None)
-                else:
-                    # If no sprites left, ensure we have an empty array
-                    self.current_object["sprites"] = []
-                self._loading_object = False
-                # Save config directly without calling _save_current_object_changes
+                self.current_object["sprites"] = [{"x": x, "y": y} for x, y in self._sprite_coords]
+                self._valid_objects.pop(id(self.current_object), None)
+                # Queue a save directly without calling _save_current_object_changes
                 # (which might trigger a reload)
-                self.save_config()
+                self._mark_dirty(self.current_object.get("id"))
                 self.log_status("Sprite removed", "success")
     
     def add_object(self):
@@ -1138,17 +1469,19 @@ class GameObjectEditor:
             self.config["game_objects"] = []
         
         self.config["game_objects"].append(new_obj)
+        if self._display_cache is not None:
+            self._display_cache.append(self._object_display(new_obj))
+        self._objects_dirty = True
         self.current_object = new_obj
+        self.current_object_idx = len(self.config["game_objects"]) - 1
         self.load_object_to_form()
-        self.refresh_object_list()
+        # Select the new object (if the filter shows it)
+        self.refresh_object_list(preserve_selection=True)
         # Refresh tile palette if it exists
         if hasattr(self, 'tile_palette_listbox'):
             self.refresh_tile_palette()
-        # Select the new object
-        self.object_listbox.selection_set(len(self.config["game_objects"]) - 1)
-        self.object_listbox.see(len(self.config["game_objects"]) - 1)
-        # Auto-save after adding object
-        self.save_config(show_message=True)
+        # Auto-save after adding object (coalesced with other quick edits)
+        self._mark_dirty(new_obj["id"])
         self.log_status("New object added", "success")
     
     def delete_object(self):
@@ -1158,9 +1491,16 @@ class GameObjectEditor:
             return
         
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this object?"):
-            if self.current_object in self.config["game_objects"]:
-                self.config["game_objects"].remove(self.current_object)
+            idx = self._current_object_index()
+            if idx is not None:
+                deleted_id = self.current_object.get("id")
+                self._valid_objects.pop(id(self.current_object), None)
+                del self.config["game_objects"][idx]
+                if self._display_cache is not None:
+                    del self._display_cache[idx]
+                self._objects_dirty = True
                 self.current_object = None
+                self.current_object_idx = None
                 self.refresh_object_list()
                 # Clear form
                 for var, _ in self.prop_vars.values():
@@ -1170,56 +1510,72 @@ class GameObjectEditor:
                         var.set("")
                 # Custom properties removed
                 self.sprite_listbox.delete(0, tk.END)
-                # Automatically save to clean up the file
-                self.save_config(show_message=True)
+                self._sprite_coords = []
+                # Automatically save to clean up the file (coalesced with other quick edits)
+                self._mark_dirty(deleted_id)
                 self.log_status("Object deleted", "success")
     
+    def _current_object_index(self):
+        """Index of current_object in game_objects (identity match), or None"""
+        objects = self.config.get("game_objects", [])
+        idx = self.current_object_idx
+        if idx is not None and idx < len(objects) and objects[idx] is self.current_object:
+            return idx
+        # Stale index (e.g. list changed since selection) - fall back to an identity scan
+        for idx, obj in enumerate(objects):
+            if obj is self.current_object:
+                return idx
+        return None
+    
     def highlight_sprite(self):
         """Highlight all sprites in the array on the sprite sheet"""
         if not self.current_object or not self.sprite_sheet_image:
             return
         
-        # Clear previous highlights
-        self.sprite_canvas.delete("highlight")
-        
         # Only highlight if the object's sprite_sheet matches the current sprite sheet
         obj_sprite_sheet = self.current_object.get("sprite_sheet")
         if obj_sprite_sheet and obj_sprite_sheet != self.current_sprite_sheet:
             # Object uses a different sprite sheet, don't highlight
+            self.sprite_canvas.delete("highlight")
+            self._last_highlight_key = None
             return
         
-        # Get sprites array
-        sprites = self.current_object.get("sprites", [])
-        # If no sprites array, check for legacy sprite_x/sprite_y
-        if not sprites:
-            sprite_x = self.current_object.get("sprite_x")
-            sprite_y = self.current_object.get("sprite_y")
-            if sprite_x is not None and sprite_y is not None:
-                sprites = [{"x": sprite_x, "y": sprite_y}]
+        # Get sprite coordinates
+        coords = tuple(
+            (sprite.get("x", 0), sprite.get("y", 0)) if isinstance(sprite, dict)
+            else (getattr(sprite, 'x', 0), getattr(sprite, 'y', 0))
+            for sprite in self.current_object.get("sprites", [])
+        )
+        
+        # Nothing to do if the same rectangles are already on the canvas
+        key = (self.current_sprite_sheet, self.zoom_level, coords)
+        if key == self._last_highlight_key and self.sprite_canvas.find_withtag("highlight"):
+            return
         
-        if not sprites:
+        # Clear previous highlights
+        self.sprite_canvas.delete("highlight")
+        self._last_highlight_key = key
+        if not coords:
             return
         
         # Calculate position based on tile coordinates and zoom
         scaled_tile_size = self.tile_size * self.zoom_level
         
-        # Highlight all sprites in the array
-        for i, sprite in enumerate(sprites):
-            x_coord = sprite.get("x", 0) if isinstance(sprite, dict) else sprite.x if hasattr(sprite, 'x') else 0
-            y_coord = sprite.get("y", 0) if isinstance(sprite, dict) else sprite.y if hasattr(sprite, 'y') else 0
-            
-            x = x_coord * scaled_tile_size
-            y = y_coord * scaled_tile_size
-            
-            # Use different colors for multiple sprites
-            color = "red" if i == 0 else "orange"
-            width = max(2, int(2 * self.zoom_level))
-            
-            # Draw highlight rectangle
-            self.sprite_canvas.create_rectangle(
-                x, y, x + scaled_tile_size, y + scaled_tile_size,
-                outline=color, width=width, tags="highlight"
-            )
+        width = max(2, int(2 * self.zoom_level))
+        rects = [
+            (x * scaled_tile_size, y * scaled_tile_size,
+             (x + 1) * scaled_tile_size, (y + 1) * scaled_tile_size)
+            for x, y in coords
+        ]
+        
+        # First sprite in red, the rest in orange
+        self.sprite_canvas.create_rectangle(*rects[0], outline="red", width=width, tags="highlight")
+        # Go straight to Tcl for the remaining frames to skip Canvas option marshalling
+        tk_call = self.sprite_canvas.tk.call
+        widget = self.sprite_canvas._w
+        for x1, y1, x2, y2 in rects[1:]:
+            tk_call(widget, "create", "rectangle", x1, y1, x2, y2,
+                    "-outline", "orange", "-width", width, "-tags", "highlight")
     
     def on_sprite_click(self, event):
         """Handle click on sprite sheet to set coordinates"""
@@ -1308,58 +1664,24 @@ class GameObjectEditor:
         """Save current object changes to memory (internal method)"""
         if not self.current_object:
             return
+        obj = self.current_object
+        self._valid_objects.pop(id(obj), None)  # Re-validate on the next save
+        
+        # Legacy properties map - top-level fields are dropped from it as they're saved
+        props = obj.get("properties")
         
         # Update properties
         for key, (var, dtype) in self.prop_vars.items():
-            if key == "health":
-                val = var.get().strip()
-                self.current_object["health"] = int(val) if val and val.lower() != "none" else None
-            elif key == "attack":
-                val = var.get().strip()
-                # Store attack as top-level property (not in properties map)
-                self.current_object["attack"] = int(val) if val and val.lower() != "none" else None
-                # Remove from properties map if it was there
-                if "properties" in self.current_object and "attack" in self.current_object["properties"]:
-                    del self.current_object["properties"]["attack"]
-            elif key == "defense":
-                val = var.get().strip()
-                # Store defense as top-level property (not in properties map)
-                self.current_object["defense"] = int(val) if val and val.lower() != "none" else None
-                # Remove from properties map if it was there
-                if "properties" in self.current_object and "defense" in self.current_object["properties"]:
-                    del self.current_object["properties"]["defense"]
-            elif key == "attack_spread_percent":
+            if key in _OPTIONAL_INT_FIELDS:
                 val = var.get().strip()
-                # Store attack_spread_percent as top-level property (not in properties map)
-                self.current_object["attack_spread_percent"] = int(val) if val and val.lower() != "none" else None
-                # Remove from properties map if it was there
-                if "properties" in self.current_object and "attack_spread_percent" in self.current_object["properties"]:
-                    del self.current_object["properties"]["attack_spread_percent"]
-            elif key == "crit_chance_percent":
-                val = var.get().strip()
-                # Store crit_chance_percent as top-level property (not in properties map)
-                self.current_object["crit_chance_percent"] = int(val) if val and val.lower() != "none" else None
-                # Remove from properties map if it was there
-                if "properties" in self.current_object and "crit_chance_percent" in self.current_object["properties"]:
-                    del self.current_object["properties"]["crit_chance_percent"]
-            elif key == "crit_damage_percent":
-                val = var.get().strip()
-                # Store crit_damage_percent as top-level property (not in properties map)
-                self.current_object["crit_damage_percent"] = int(val) if val and val.lower() != "none" else None
-                # Remove from properties map if it was there
-                if "properties" in self.current_object and "crit_damage_percent" in self.current_object["properties"]:
-                    del self.current_object["properties"]["crit_damage_percent"]
-            elif key == "healing_power":
-                val = var.get().strip()
-                # Store healing_power as top-level property (not in properties map)
-                self.current_object["healing_power"] = int(val) if val and val.lower() != "none" else None
-                # Remove from properties map if it was there
-                if "properties" in self.current_object and "healing_power" in self.current_object["properties"]:
-                    del self.current_object["properties"]["healing_power"]
+                # Stored top-level (None when blank), never in the properties map
+                obj[key] = _safe_int(val, None)
+                if props is not None:
+                    props.pop(key, None)
             elif key == "sprite_sheet":
                 val = var.get().strip()
                 if val:
-                    self.current_object["sprite_sheet"] = val
+                    obj["sprite_sheet"] = val
                     # Switch to this sprite sheet if it's different
                     if val != self.current_sprite_sheet and val in self.sprite_sheet_combo['values']:
                         self.sprite_sheet_var.set(val)
@@ -1368,108 +1690,131 @@ class GameObjectEditor:
                 # Only update if a new value is provided
             elif key == "monster":
                 # Store monster as top-level boolean property (not in properties map)
-                self.current_object["monster"] = var.get()
-                # Remove from properties map if it was there
-                if "properties" in self.current_object and "monster" in self.current_object["properties"]:
-                    del self.current_object["properties"]["monster"]
+                obj["monster"] = var.get()
+                if props is not None:
+                    props.pop("monster", None)
             elif dtype == bool:
-                self.current_object[key] = var.get()
+                obj[key] = var.get()
             elif dtype == int:
-                val = var.get().strip() if isinstance(var.get(), str) else str(var.get())
-                # Handle "None" string and empty values
-                if not val or val.lower() == "none":
-                    # Only set to None if this is an optional field (not required)
-                    # For required int fields, use 0 as default
-                    self.current_object[key] = None if key in ["health", "attack", "defense", "attack_spread_percent", "crit_chance_percent", "crit_damage_percent", "healing_power"] else 0
-                else:
-                    try:
-                        self.current_object[key] = int(val)
-                    except ValueError:
-                        self.current_object[key] = 0
+                val = var.get()
+                val = val.strip() if isinstance(val, str) else str(val)
+                # Optional int fields were handled above - required ones default to 0
+                # (covers empty, "None" and unparseable values)
+                obj[key] = _safe_int(val)
             else:
-                self.current_object[key] = var.get()
-        
-        # Update sprite array from listbox
-        sprites = []
-        for i in range(self.sprite_listbox.size()):
-            text = self.sprite_listbox.get(i)
-            # Parse "(x, y)" format
-            import re
-            match = re.match(r'\((\d+),\s*(\d+)\)', text)
-            if match:
-                sprites.append({"x": int(match.group(1)), "y": int(match.group(2))})
-        self.current_object["sprites"] = sprites
+                obj[key] = var.get()
+        
+        # Update sprite array from the listbox rows
+        sprites = [{"x": x, "y": y} for x, y in self._sprite_coords]
+        obj["sprites"] = sprites
         
         # Remove legacy fields if sprites array exists and has items
         if sprites and len(sprites) > 0:
-            self.current_object.pop("sprite_x", None)
-            self.current_object.pop("sprite_y", None)
+            obj.pop("sprite_x", None)
+            obj.pop("sprite_y", None)
         
         # Update interactable data - for chest objects, set interactable marker if sprites array has at least 2 sprites
-        obj_type = self.current_object.get("object_type", "")
+        obj_type = obj.get("object_type", "")
         if obj_type == "chest":
             # If we have at least 2 sprites, mark as interactable
             if len(sprites) >= 2:
-                self.current_object["interactable"] = {}  # Empty object - just a marker
+                obj["interactable"] = {}  # Empty object - just a marker
             else:
                 # Remove interactable if not enough sprites
-                self.current_object.pop("interactable", None)
+                obj.pop("interactable", None)
         else:
             # Remove interactable if not a chest
-            self.current_object.pop("interactable", None)
+            obj.pop("interactable", None)
         
         # Preserve sprite_sheet if it exists - don't remove it
         # It will be updated by the form field if changed, but won't be removed
         
         # Custom properties removed - all properties are now handled through schema fields
         # Ensure properties map exists for backward compatibility but keep it empty
-        if "properties" not in self.current_object:
-            self.current_object["properties"] = {}
+        obj.setdefault("properties", {})
         
         # Refresh the object list to show updated name (preserve selection)
         # Only refresh if we're not in the middle of loading (to avoid reloading sprites)
         if not getattr(self, '_loading_object', False):
+            # Name or type may have changed - update just this object's list text
+            idx = self._current_object_index()
+            if self._display_cache is None or idx is None:
+                self._objects_dirty = True
+            else:
+                display = self._object_display(obj)
+                if display != self._display_cache[idx]:
+                    self._display_cache[idx] = display
+                    self._objects_dirty = True
             self.refresh_object_list(preserve_selection=True)
         
-        # Auto-save after updating object
-        self.save_config()
+        # Write to disk on the coalesced timer rather than on every edit
+        self._mark_dirty(obj.get("id"))
+    
+    def _mark_dirty(self, obj_id):
+        """Record an in-memory edit and make sure a disk flush is scheduled"""
+        self._dirty_ids.add(obj_id)
+        self._objects_version += 1
+        self._schedule_flush()
+    
+    def _mark_levels_dirty(self):
+        """Record an in-memory level edit (game_objects caches stay valid)"""
+        self._dirty_ids.add(_LEVELS_DIRTY)
+        self._schedule_flush()
+    
+    def _schedule_flush(self):
+        """Make sure a coalesced disk flush is scheduled"""
+        if self._flush_job is None:
+            self._flush_job = self.root.after(500, self._flush_dirty)
+    
+    def _flush_dirty(self, force=False, wait=False):
+        """Write pending edits to disk, at most once every 5 seconds unless forced
+        
+        Args:
+            wait: If True, the file is up to date on disk when this returns
+        """
+        if self._flush_job is not None:
+            self.root.after_cancel(self._flush_job)
+            self._flush_job = None
+        # When waiting, a background save still in flight also has to land first
+        if not self._dirty_ids and not (wait and self._saves_in_flight):
+            return
+        remaining = 5.0 - (time.monotonic() - self._last_save)
+        if not force and remaining > 0:
+            self._flush_job = self.root.after(int(remaining * 1000), self._flush_dirty)
+            return
+        self.save_config(wait=wait)
+    
+    def _flush_pending_edits(self, wait=True):
+        """Apply any debounced property edit and write everything to disk now
+        
+        Args:
+            wait: If True, the file is up to date on disk when this returns
+        """
+        if self._auto_save_job is not None:
+            self.root.after_cancel(self._auto_save_job)
+            self._auto_save_object()
+        self._flush_level_save()
+        self._flush_dirty(force=True, wait=wait)
+    
+    def on_close(self):
+        """Flush unsaved edits before the window closes"""
+        self._flush_pending_edits()
+        self.root.destroy()
     
     def save_object(self):
         """Save current object changes (kept for backward compatibility, now calls save_all)"""
         self.save_all()
     
-    def save_config(self, show_message=False):
+    def save_config(self, show_message=False, wait=False):
         """Save config to file with proper formatting
         
         Args:
             show_message: If True, show success message. Default False for auto-save.
+            wait: If True, write on the calling thread before returning (e.g. before the
+                server reads the file or the app exits). Otherwise write in the background.
         """
         # Validate before saving
-        schema = self.get_required_schema()
-        required_fields = schema['required_fields']
-        type_specific = schema['type_specific']
-        
-        issues = []
-        for idx, obj in enumerate(self.config.get("game_objects", [])):
-            missing_fields = []
-            obj_type = obj.get("object_type", "unknown")
-            
-            # Check required fields
-            for field in required_fields:
-                if field == 'sprites':
-                    if 'sprites' not in obj or not isinstance(obj.get('sprites'), list):
-                        missing_fields.append('sprites')
-                elif field not in obj:
-                    missing_fields.append(field)
-            
-            # Check type-specific
-            if obj_type in type_specific:
-                for field in type_specific[obj_type]:
-                    if field not in obj or obj[field] is None:
-                        missing_fields.append(field)
-            
-            if missing_fields:
-                issues.append((idx, obj.get('id', f'object_{idx}'), obj.get('name', 'Unnamed'), missing_fields))
+        issues = self._find_schema_issues()
         
         if issues:
             # Show validation dialog and prevent save
@@ -1484,14 +1829,18 @@ class GameObjectEditor:
                 # Ensure sprites is a list
                 if "sprites" not in obj:
                     obj["sprites"] = []
-                # Convert sprites to proper format if needed
-                if obj["sprites"]:
+                # Convert sprites to proper format if needed (they're normally all dicts already)
+                sprites = obj["sprites"]
+                if not all(isinstance(sprite, dict) for sprite in sprites):
                     cleaned_sprites = []
-                    for sprite in obj["sprites"]:
+                    for sprite in sprites:
                         if isinstance(sprite, dict):
                             cleaned_sprites.append(sprite)
-                        elif hasattr(sprite, 'x') and hasattr(sprite, 'y'):
-                            cleaned_sprites.append({"x": sprite.x, "y": sprite.y})
+                        else:
+                            try:
+                                cleaned_sprites.append({"x": sprite.x, "y": sprite.y})
+                            except AttributeError:
+                                pass  # Not a sprite - drop it
                     obj["sprites"] = cleaned_sprites
                 
                 # Preserve all existing fields - don't remove sprite_sheet, properties, etc.
@@ -1501,42 +1850,120 @@ class GameObjectEditor:
                     obj.pop("sprite_x", None)
                     obj.pop("sprite_y", None)
             
-            # Write with proper formatting
-            with open(self.config_path, 'w') as f:
-                toml.dump(self.config, f)
-            
-            # Verify the saved file is valid
-            try:
-                with open(self.config_path, 'r') as f:
-                    toml.load(f)  # Validate it can be parsed
-            except Exception as e:
-                self.log_status(f"Config saved but validation failed: {e}", "warning")
-                return
-            
-            if show_message:
-                self.log_status(f"Config saved to {self.config_path.name}", "success")
-            # Update server status after saving
-            self.root.after(500, self.check_server_status)
-            return True
+            # Snapshot the config so later edits don't race the writer thread
+            # (pickling to bytes is several times faster than deepcopy on the Tk thread)
+            data = pickle.dumps(self.config, pickle.HIGHEST_PROTOCOL)
         except Exception as e:
             self.log_status(f"Failed to save config: {e}", "error")
             return False
+        
+        self._dirty_ids.clear()
+        self._last_save = time.monotonic()
+        
+        # Skip the write if the snapshot is identical to the last one written
+        # (unless a caller waiting for the file would otherwise race a background write)
+        snapshot_hash = _snapshot_digest(data)
+        if snapshot_hash == self._last_saved_hash and not (wait and self._saves_in_flight):
+            if show_message:
+                self.log_status("No changes to save", "info")
+            return True
+        self._last_saved_hash = snapshot_hash
+        self._save_generation += 1
+        generation = self._save_generation
+        # Re-parsing the written file is only worth it for explicit saves (or when debugging)
+        verify = show_message or bool(os.environ.get("EDITOR_VERIFY_SAVE"))
+        
+        if wait:
+            return self._finish_save(self._write_config_file(data, generation, verify), show_message)
+        
+        # Serialize and write in the background so large configs don't freeze the UI
+        threading.Thread(
+            target=lambda: self._save_queue.put((self._write_config_file(data, generation, verify), show_message)),
+            daemon=True
+        ).start()
+        self._saves_in_flight += 1
+        if self._saves_in_flight == 1:
+            self.root.after(50, self._poll_save_results)
+        return True
+    
+    def _write_config_file(self, data, generation, verify=False):
+        """Write a config snapshot via a temp file and os.replace (runs off the Tk thread)
+        
+        Args:
+            data: Pickled config snapshot taken by save_config
+            verify: If True, check the temp file parses before it replaces the config
+        
+        Returns:
+            None on success (or if a newer snapshot superseded this one), else the exception
+        """
+        with self._save_lock:
+            if generation != self._save_generation:
+                return None  # A newer snapshot will be written instead
+            tmp_path = self.config_path.with_suffix(".toml.tmp")
+            try:
+                payload = _dumps_toml(pickle.loads(data)).encode('utf-8')
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)  # One write call for the whole document
+                    f.flush()
+                    os.fsync(f.fileno())  # On disk before the rename makes it the config
+                if verify:
+                    # Verify the written file parses before it replaces the config
+                    _read_toml(tmp_path)
+                os.replace(tmp_path, self.config_path)
+            except Exception as e:
+                return e
+        return None
+    
+    def _poll_save_results(self):
+        """Report finished background saves on the Tk thread"""
+        while True:
+            try:
+                error, show_message = self._save_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._saves_in_flight -= 1
+            self._finish_save(error, show_message)
+        
+        if self._saves_in_flight > 0:
+            self.root.after(50, self._poll_save_results)
+    
+    def _finish_save(self, error, show_message):
+        """Update the UI after a config write"""
+        if error is not None:
+            self._last_saved_hash = None  # The file may not match any snapshot - write next time
+            self.log_status(f"Failed to save config: {error}", "error")
+            return False
+        
+        # The server regenerates maps from the saved config, so drop any prefetched map
+        self._map_fetch_generation += 1
+        self._prefetched_map = None
+        
+        if show_message:
+            self.log_status(f"Config saved to {self.config_path.name}", "success")
+        return True
     
     def find_server_process(self):
         """Find the running server process"""
+        # A PID found moments ago is still good if the process is alive (saves a subprocess).
+        # Not on Windows: os.kill(pid, 0) there terminates the process instead of probing it.
+        cached = self._server_pid_cache
+        if (cached and _SYSTEM != "Windows" and time.monotonic() - cached[1] < 2.0
+                and self._process_alive(cached[0])):
+            return cached[0]
+        pid = self._find_server_process_uncached()
+        self._server_pid_cache = (pid, time.monotonic()) if pid else None
+        return pid
+    
+    def _find_server_process_uncached(self):
+        """Look up the server PID by port (or by process name as a fallback)"""
         try:
             # Try to find process using port 3000
-            if platform.system() == "Darwin":  # macOS
-                result = subprocess.run(
-                    ["lsof", "-ti", ":3000"],
-                    capture_output=True,
-                    text=True,
-                    timeout=2
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    pid = int(result.stdout.strip().split('\n')[0])
+            if _SYSTEM == "Linux":
+                # Read /proc directly rather than forking lsof
+                pid = _find_listening_pid_proc(3000)
+                if pid:
                     return pid
-            elif platform.system() == "Linux":
+            if _SYSTEM in ("Darwin", "Linux"):
                 result = subprocess.run(
                     ["lsof", "-ti", ":3000"],
                     capture_output=True,
@@ -1546,7 +1973,7 @@ class GameObjectEditor:
                 if result.returncode == 0 and result.stdout.strip():
                     pid = int(result.stdout.strip().split('\n')[0])
                     return pid
-            elif platform.system() == "Windows":
+            elif _SYSTEM == "Windows":
                 result = subprocess.run(
                     ["netstat", "-ano"],
                     capture_output=True,
@@ -1565,7 +1992,7 @@ class GameObjectEditor:
             
             # Fallback: try to find cargo/rust process
             result = subprocess.run(
-                ["ps", "aux"] if platform.system() != "Windows" else ["tasklist"],
+                ["ps", "aux"] if _SYSTEM != "Windows" else ["tasklist"],
                 capture_output=True,
                 text=True,
                 timeout=2
@@ -1575,7 +2002,7 @@ class GameObjectEditor:
                     parts = line.split()
                     if len(parts) > 1:
                         try:
-                            pid = int(parts[1] if platform.system() != "Windows" else parts[1].split('.')[0])
+                            pid = int(parts[1] if _SYSTEM != "Windows" else parts[1].split('.')[0])
                             return pid
                         except (ValueError, IndexError):
                             pass
@@ -1586,22 +2013,49 @@ class GameObjectEditor:
     def kill_server_process(self, pid):
         """Kill the server process"""
         try:
-            if platform.system() == "Windows":
+            if _SYSTEM == "Windows":
                 subprocess.run(["taskkill", "/F", "/PID", str(pid)], timeout=5)
             else:
-                os.kill(pid, signal.SIGTERM)
-                # Wait a bit, then force kill if still running
-                import time
-                time.sleep(1)
-                try:
-                    os.kill(pid, signal.SIGKILL)
-                except ProcessLookupError:
-                    pass  # Already dead
+                # Servers started from here run in their own session (cargo + game binary),
+                # so signal the whole group with one call
+                pgid = os.getpgid(pid)
+                if self.server_process is not None and pgid == self.server_process.pid:
+                    send = lambda sig: os.killpg(pgid, sig)
+                else:
+                    send = lambda sig: os.kill(pid, sig)
+                send(signal.SIGTERM)
+                # Give it up to a second to exit, then force kill if still running
+                # (polling with backoff so a quick exit returns in a few ms)
+                deadline = time.monotonic() + 1.0
+                delay = 0.01
+                while self._process_alive(pid) and time.monotonic() < deadline:
+                    time.sleep(delay)
+                    delay = min(delay * 2, 0.2)
+                if self._process_alive(pid):
+                    try:
+                        send(signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass  # Already dead
             return True
+        except ProcessLookupError:
+            return True  # Exited before it could be signalled
         except Exception as e:
             print(f"Error killing server process: {e}")
             return False
     
+    def _process_alive(self, pid):
+        """Check whether a process is still running (POSIX only - never call this on Windows)"""
+        if self.server_process is not None and pid == self.server_process.pid:
+            # Our own child stays a zombie until reaped, so ask Popen
+            return self.server_process.poll() is None
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass  # Exists but owned by another user
+        return True
+    
     def start_server(self, rebuild=False):
         """Start the server process
         
@@ -1615,7 +2069,7 @@ class GameObjectEditor:
             if rebuild:
                 # Rebuild the project first
                 self.server_status_label.config(text="Server: Rebuilding...", foreground="orange")
-                self.root.update()
+                self.root.update_idletasks()
                 
                 build_process = subprocess.Popen(
                     ["cargo", "build"],
@@ -1644,21 +2098,54 @@ class GameObjectEditor:
             print(f"Error starting server: {e}")
             return False
     
-    def check_server_status(self):
-        """Check if server is running and update status label"""
-        pid = self.find_server_process()
-        if pid:
+    def _probe_server(self):
+        """Return True if something accepts connections on the server port"""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.05)
+            return sock.connect_ex(("127.0.0.1", 3000)) == 0
+    
+    def _wait_for_server(self, running, timeout):
+        """Poll the server port until it is (or isn't) accepting connections
+        
+        Returns:
+            bool: True if the server reached the wanted state within timeout seconds
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.02
+        while self._probe_server() != running:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 2, 0.25)
+        return True
+    
+    def check_server_status(self, only_on_change=False):
+        """Check if server is running and update status label
+        
+        Args:
+            only_on_change: If True, leave the label alone unless the running state changed
+        """
+        running = self._probe_server()
+        if only_on_change and running == self._server_running:
+            return
+        self._server_running = running
+        if running:
             self.server_status_label.config(text="Server: Running", foreground="green")
         else:
             self.server_status_label.config(text="Server: Stopped", foreground="red")
     
+    def _watch_server_status(self):
+        """Re-probe the server every 10 seconds to catch it starting or stopping elsewhere"""
+        self.check_server_status(only_on_change=True)
+        self.root.after(10000, self._watch_server_status)
+    
     def shutdown_server(self):
         """Shutdown the server process"""
         pid = self.find_server_process()
         if pid:
             if messagebox.askyesno("Shutdown Server", "Are you sure you want to shutdown the server?"):
                 self.server_status_label.config(text="Server: Shutting down...", foreground="orange")
-                self.root.update()
+                self.root.update_idletasks()
                 if self.kill_server_process(pid):
                     self.log_status("Server shutdown successfully", "success")
                     self.server_status_label.config(text="Server: Stopped", foreground="red")
@@ -1674,6 +2161,8 @@ class GameObjectEditor:
     
     def restart_server(self):
         """Restart the server"""
+        # The server reads game_config.toml at startup
+        self._flush_pending_edits()
         try:
             # Find and kill existing server
             pid = self.find_server_process()
@@ -1684,32 +2173,28 @@ class GameObjectEditor:
                     return
                 
                 self.server_status_label.config(text="Server: Stopping...", foreground="orange")
-                self.root.update()
+                self.root.update_idletasks()
                 
                 if not self.kill_server_process(pid):
                     self.log_status("Failed to stop the server", "error")
                     self.check_server_status()
                     return
                 
-                # Wait a moment for process to die and port to be released
-                import time
-                time.sleep(2)
-                
-                # Verify port is free
-                check_pid = self.find_server_process()
-                if check_pid:
+                # Wait for the port to be released
+                if not self._wait_for_server(False, 2.0):
                     # Force kill if still running
-                    self.kill_server_process(check_pid)
-                    time.sleep(1)
+                    check_pid = self.find_server_process()
+                    if check_pid:
+                        self.kill_server_process(check_pid)
+                        self._wait_for_server(False, 1.0)
             
             # Start new server (with rebuild to ensure latest code)
             self.server_status_label.config(text="Server: Starting...", foreground="orange")
-            self.root.update()
+            self.root.update_idletasks()
             
             if self.start_server(rebuild=True):
-                # Wait a moment and check if it started
-                import time
-                time.sleep(3)  # Give it more time to start
+                # Give it up to 3 seconds to start listening
+                self._wait_for_server(True, 3.0)
                 self.check_server_status()
                 
                 # Check if server actually started
@@ -1726,37 +2211,42 @@ class GameObjectEditor:
             self.log_status(f"Failed to restart server: {e}", "error")
             self.check_server_status()
     
-    def _find_tile_id_by_properties(self, tile_data):
-        """Find a tile ID that matches the given tile properties"""
-        # Try to match by sprite coordinates first
-        sprite_x = tile_data.get("sprite_x", 0)
-        sprite_y = tile_data.get("sprite_y", 0)
-        walkable = tile_data.get("walkable", False)
+    def _build_tile_lookup(self):
+        """Index tile objects for _find_tile_id_by_properties
         
-        # Look for matching tile in config
+        Returns:
+            tuple: ({(sprite_x, sprite_y, walkable): tile_id}, {walkable: tile_id}),
+                keeping the first matching tile in config order
+        """
+        by_sprite = {}
+        by_walkable = {}
         for obj in self.config.get("game_objects", []):
             if obj.get("object_type") != "tile":
                 continue
-            if obj.get("walkable") != walkable:
-                continue
-            
-            # Check if sprite matches
-            sprites = obj.get("sprites", [])
-            if sprites:
-                for sprite in sprites:
-                    if sprite.get("x") == sprite_x and sprite.get("y") == sprite_y:
-                        return obj.get("id")
-            # Fallback to legacy sprite_x/sprite_y
-            if obj.get("sprite_x") == sprite_x and obj.get("sprite_y") == sprite_y:
-                return obj.get("id")
-        
-        # If no exact match, return first tile with matching walkable property
-        for obj in self.config.get("game_objects", []):
-            if obj.get("object_type") == "tile" and obj.get("walkable") == walkable:
-                return obj.get("id")
+            walkable = obj.get("walkable")
+            obj_id = obj.get("id")
+            by_walkable.setdefault(walkable, obj_id)
+            for sprite in obj.get("sprites", []):
+                by_sprite.setdefault((sprite.get("x"), sprite.get("y"), walkable), obj_id)
+        return by_sprite, by_walkable
+    
+    def _find_tile_id_by_properties(self, tile_data, tile_lookup=None):
+        """Find a tile ID that matches the given tile properties
+        
+        Args:
+            tile_lookup: Result of _build_tile_lookup, reused across a whole map
+        """
+        by_sprite, by_walkable = tile_lookup or self._build_tile_lookup()
+        walkable = tile_data.get("walkable", False)
+        
+        # Try to match by sprite coordinates first
+        tile_id = by_sprite.get((tile_data.get("sprite_x", 0), tile_data.get("sprite_y", 0), walkable))
+        if tile_id is None:
+            # If no exact match, use the first tile with matching walkable property
+            tile_id = by_walkable.get(walkable)
         
         # Ultimate fallback
-        return "wall_dirt_top"
+        return tile_id if tile_id is not None else "wall_dirt_top"
     
     def create_level_tab_ui(self):
         """Create the UI for the Level Editor tab"""
@@ -1847,6 +2337,7 @@ class GameObjectEditor:
         
         # Store monster checkboxes
         self.monster_checkboxes = {}  # {monster_id: (checkbox_var, checkbox_widget)}
+        self._monster_rows = None  # (id, name) per checkbox, to skip rebuilding an identical list
         
         # Populate monster checkboxes
         self.refresh_monster_list()
@@ -1884,8 +2375,9 @@ class GameObjectEditor:
                                           xscrollcommand=h_scrollbar.set)
         self.level_map_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        v_scrollbar.config(command=self.level_map_canvas.yview)
-        h_scrollbar.config(command=self.level_map_canvas.xview)
+        v_scrollbar.config(command=partial(self._on_level_map_scroll, self.level_map_canvas.yview))
+        h_scrollbar.config(command=partial(self._on_level_map_scroll, self.level_map_canvas.xview))
+        self.level_map_canvas.bind("<Configure>", lambda e: self._draw_visible_map_tiles(self.level_map_canvas))
         
         # Map zoom controls
         zoom_frame = ttk.Frame(right_panel)
@@ -1913,7 +2405,14 @@ class GameObjectEditor:
         self.level_map_rooms = []
         self.level_map_zoom_level = 1.0
         self.level_map_stairs_position = None
-        
+
+        # Background map fetching (keeps the UI responsive while the server generates)
+        self._map_fetch_queue = queue.Queue()  # Results posted by worker threads
+        self._map_fetches_in_flight = 0
+        self._map_fetch_pending = False  # True while a user-requested fetch is running
+        self._map_fetch_generation = 0  # Bumped on config save to discard stale prefetches
+        self._prefetched_map = None  # (level_number, data) fetched ahead of the next click
+
         # Configure grid weights
         self.level_tab.columnconfigure(2, weight=1)
         self.level_tab.columnconfigure(1, weight=0)
@@ -1921,6 +2420,16 @@ class GameObjectEditor:
         middle_panel.columnconfigure(1, weight=1)
         middle_panel.rowconfigure(7, weight=1)  # Allow monster checkbox area to expand
     
+    def _get_sorted_monsters(self):
+        """Monster characters sorted by name, rebuilt only after game_objects changes"""
+        cached = self._monsters_cache
+        if cached is not None and cached[0] == self._objects_version:
+            return cached[1]
+        monsters = [obj for obj in self.config.get("game_objects", []) if _is_monster(obj)]
+        monsters.sort(key=lambda x: x.get("name", x.get("id", "")))
+        self._monsters_cache = (self._objects_version, monsters)
+        return monsters
+    
     def refresh_monster_list(self):
         """Populate the monster checkboxes with available monster characters"""
         if not hasattr(self, 'monster_checkbox_container'):
@@ -1928,31 +2437,21 @@ class GameObjectEditor:
         if not self.config or "game_objects" not in self.config:
             return
         
+        rows = tuple((monster.get("id", ""), monster.get("name", monster.get("id", "Unknown")))
+                     for monster in self._get_sorted_monsters())
+        
+        # Same checkboxes as last time - keep them (and their checked state)
+        if rows == self._monster_rows:
+            return
+        self._monster_rows = rows
+        
         # Clear existing checkboxes
         for widget in self.monster_checkbox_container.winfo_children():
             widget.destroy()
         self.monster_checkboxes.clear()
         
-        # Get all monster characters
-        monsters = []
-        for obj in self.config.get("game_objects", []):
-            if obj.get("object_type") == "character":
-                monster = obj.get("monster", False)
-                if isinstance(monster, bool) and monster:
-                    monsters.append(obj)
-                elif isinstance(monster, str) and monster.lower() == "true":
-                    monsters.append(obj)
-                elif "properties" in obj and obj["properties"].get("monster") == "true":
-                    monsters.append(obj)
-        
-        # Sort by name
-        monsters.sort(key=lambda x: x.get("name", x.get("id", "")))
-        
         # Create checkboxes for each monster
-        for monster in monsters:
-            monster_id = monster.get("id", "")
-            name = monster.get("name", monster.get("id", "Unknown"))
-            
+        for monster_id, name in rows:
             var = tk.BooleanVar()
             var.trace_add("write", lambda *args, mid=monster_id: self.on_monster_checkbox_change(mid))
             
@@ -1966,11 +2465,14 @@ class GameObjectEditor:
             self.monster_checkboxes[monster_id] = (var, checkbox)
     
     def on_monster_checkbox_change(self, monster_id):
-        """Handle monster checkbox change - save immediately"""
-        self._save_current_level_changes()
+        """Handle monster checkbox change - save with the other level edits"""
+        self._schedule_level_save()
     
     def on_level_select(self, event):
         """Handle level selection"""
+        # Edits to the previously selected level go to that level, not the new one
+        self._flush_level_save()
+        
         selection = self.level_listbox.curselection()
         if not selection:
             return
@@ -1995,11 +2497,15 @@ class GameObjectEditor:
         allowed = level.get("allowed_monsters", [])
         print(f"[EDITOR] Loading level - allowed_monsters: {allowed}")  # Debug
         
-        # Update checkboxes based on allowed monsters
+        # Update checkboxes based on allowed monsters (set membership, not list scans)
+        allowed_set = set(allowed)
+        checked = 0
         for monster_id, (var, checkbox) in self.monster_checkboxes.items():
-            var.set(monster_id in allowed)
+            is_allowed = monster_id in allowed_set
+            var.set(is_allowed)
+            checked += is_allowed
         
-        print(f"[EDITOR] Set {len([m for m in allowed if m in self.monster_checkboxes])} monster checkboxes")  # Debug
+        print(f"[EDITOR] Set {checked} monster checkboxes")  # Debug
     
     def add_level(self):
         """Add a new level"""
@@ -2014,16 +2520,7 @@ class GameObjectEditor:
             next_level = max_level + 1
         
         # Get all monster IDs as default
-        monster_ids = []
-        for obj in self.config.get("game_objects", []):
-            if obj.get("object_type") == "character":
-                monster = obj.get("monster", False)
-                if isinstance(monster, bool) and monster:
-                    monster_ids.append(obj.get("id", ""))
-                elif isinstance(monster, str) and monster.lower() == "true":
-                    monster_ids.append(obj.get("id", ""))
-                elif "properties" in obj and obj["properties"].get("monster") == "true":
-                    monster_ids.append(obj.get("id", ""))
+        monster_ids = [monster.get("id", "") for monster in self._get_sorted_monsters()]
         
         new_level = {
             "level_number": next_level,
@@ -2036,12 +2533,13 @@ class GameObjectEditor:
         }
         
         self.config["levels"].append(new_level)
-        self.save_config()
+        self._mark_levels_dirty()
         self.refresh_level_list()
         self.log_status(f"Added level {next_level}", "success")
     
     def delete_level(self):
         """Delete selected level"""
+        self._flush_level_save()  # Before indices shift
         selection = self.level_listbox.curselection()
         if not selection:
             self.log_status("No level selected", "error")
@@ -2057,7 +2555,7 @@ class GameObjectEditor:
         
         if messagebox.askyesno("Confirm Delete", f"Delete level {level_num}?"):
             del levels[index]
-            self.save_config()
+            self._mark_levels_dirty()
             self.refresh_level_list()
             self.log_status(f"Deleted level {level_num}", "success")
     
@@ -2075,27 +2573,43 @@ class GameObjectEditor:
         # Sort by level number
         sorted_levels = sorted(levels, key=lambda x: x.get("level_number", 0))
         
-        for level in sorted_levels:
-            level_num = level.get("level_number", 0)
-            self.level_listbox.insert(tk.END, f"Level {level_num}")
+        level_texts = [f"Level {level.get('level_number', 0)}" for level in sorted_levels]
+        if level_texts:
+            self.level_listbox.insert(tk.END, *level_texts)
         
         # Auto-save level changes when fields change (set up once)
         if not hasattr(self, '_level_traces_setup'):
             for var in [self.level_number_var, self.min_rooms_var, self.max_rooms_var, 
                        self.min_monsters_var, self.max_monsters_var, self.chest_count_var]:
-                var.trace_add("write", lambda *args: self._save_current_level_changes())
+                var.trace_add("write", lambda *args: self._schedule_level_save())
             self._level_traces_setup = True
     
-    def _save_current_level_changes(self):
-        """Save current level changes to config"""
+    def _schedule_level_save(self):
+        """Debounce level form edits so a burst of keystrokes saves once"""
         if not hasattr(self, 'level_listbox') or not self.level_listbox:
             return
-        
         selection = self.level_listbox.curselection()
         if not selection:
             return
+        if self._level_save_job is not None:
+            self.root.after_cancel(self._level_save_job)
+        # Remember which level is being edited in case the selection moves before the save
+        self._level_save_index = selection[0]
+        self._level_save_job = self.root.after(250, partial(self._save_current_level_changes, self._level_save_index))
+    
+    def _flush_level_save(self):
+        """Run a pending debounced level save now"""
+        if self._level_save_job is not None:
+            self.root.after_cancel(self._level_save_job)
+            self._save_current_level_changes(self._level_save_index)
+    
+    def _save_current_level_changes(self, index):
+        """Save the level form into config
         
-        index = selection[0]
+        Args:
+            index: Level to save into (the level selected when the edit was made)
+        """
+        self._level_save_job = None
         levels = self.config.get("levels", [])
         if index >= len(levels):
             return
@@ -2119,7 +2633,7 @@ class GameObjectEditor:
             level["allowed_monsters"] = allowed_ids
             print(f"[EDITOR] Saved {len(allowed_ids)} allowed monsters: {allowed_ids}")  # Debug
             
-            self.save_config()
+            self._mark_levels_dirty()
         except (ValueError, IndexError):
             pass  # Ignore invalid input while typing
     
@@ -2136,46 +2650,104 @@ class GameObjectEditor:
             self.log_status("Invalid level selection", "error")
             return
         
+        # The server generates the map from the config file, so write pending edits first
+        self._flush_pending_edits()
+        
         level = levels[index]
+        level_num = level.get("level_number", 0)
+        
+        # Use the map prefetched in the background if it matches this level
+        if self._prefetched_map and self._prefetched_map[0] == level_num:
+            data = self._prefetched_map[1]
+            self._prefetched_map = None
+            self._apply_level_map(level, data)
+            self._start_map_fetch(level, prefetch=True)
+            return
         
+        if self._map_fetch_pending:
+            self.log_status("Map generation already in progress...", "info")
+            return
+        
+        self.log_status(f"Generating map for Level {level_num}...", "info")
+        self._map_fetch_pending = True
+        self._start_map_fetch(level, prefetch=False)
+    
+    def _start_map_fetch(self, level, prefetch):
+        """Request a map from the server in a worker thread
+        
+        Args:
+            level: Level config dict the map is generated for
+            prefetch: If True, stash the result for the next "Generate" click instead of rendering it
+        """
+        level_num = level.get("level_number", 0)
+        generation = self._map_fetch_generation
+        threading.Thread(
+            target=self._fetch_map_worker,
+            args=(level, level_num, prefetch, generation),
+            daemon=True
+        ).start()
+        self._map_fetches_in_flight += 1
+        if self._map_fetches_in_flight == 1:
+            self.root.after(50, self._poll_map_fetch)
+    
+    def _fetch_map_worker(self, level, level_num, prefetch, generation):
+        """Fetch and parse a generated map (runs off the Tk thread - must not touch widgets)"""
+        import urllib.request
+        url = f"http://localhost:3000/api/map?level={level_num}"
         try:
-            self.log_status(f"Generating map for Level {level.get('level_number', 0)}...", "info")
-            
-            # Make HTTP request to the server's map generation endpoint
-            import urllib.request
-            import json
-            
-            # Get level number from selected level
-            level_num = level.get("level_number", 0)
-            url = f"http://localhost:3000/api/map?level={level_num}"
+            with urllib.request.urlopen(url, timeout=30) as response:
+                data = json.loads(response.read())
+            self._map_fetch_queue.put((level, prefetch, generation, data, None))
+        except Exception as e:
+            self._map_fetch_queue.put((level, prefetch, generation, None, e))
+    
+    def _poll_map_fetch(self):
+        """Pick up finished map fetches on the Tk thread"""
+        while True:
             try:
-                self.log_status(f"Requesting map from server...", "info")
-                with urllib.request.urlopen(url, timeout=30) as response:
-                    self.log_status(f"Received response, parsing...", "info")
-                    data = json.loads(response.read().decode())
-                    self.log_status(f"Map generated successfully!", "success")
-            except urllib.error.URLError as e:
-                self.log_status(f"Failed to connect to server: {e}. Make sure the server is running on port 3000.", "error")
-                return
-            except Exception as e:
-                self.log_status(f"Error generating map: {e}", "error")
-                import traceback
-                traceback.print_exc()
-                return
+                level, prefetch, generation, data, error = self._map_fetch_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._map_fetches_in_flight -= 1
+            
+            if prefetch:
+                # Keep the prefetched map only if the config hasn't been saved since
+                if error is None and generation == self._map_fetch_generation:
+                    self._prefetched_map = (level.get("level_number", 0), data)
+                continue
             
+            self._map_fetch_pending = False
+            if isinstance(error, urllib.error.URLError):
+                self.log_status(f"Failed to connect to server: {error}. Make sure the server is running on port 3000.", "error")
+            elif error is not None:
+                self.log_status(f"Error generating map: {error}", "error")
+            else:
+                self._apply_level_map(level, data)
+                # Generate the next map in the background so the next click is instant
+                self._start_map_fetch(level, prefetch=True)
+        
+        if self._map_fetches_in_flight > 0:
+            self.root.after(50, self._poll_map_fetch)
+    
+    def _apply_level_map(self, level, data):
+        """Load a map returned by the server into the level preview"""
+        # Start new maps with fresh tile images in case a sprite sheet was edited
+        self._level_map_sprite_images = None
+        self._level_map_fullscreen_sprite_images = None
+        self._level_map_composite = None
+        try:
             # Parse the response
             self.level_map_width = data.get("width", 80)
             self.level_map_height = data.get("height", 50)
             
             # Convert map tiles to tile IDs
             map_tiles = data.get("map", [])
-            self.level_map_data = []
-            for row in map_tiles:
-                tile_row = []
-                for tile in row:
-                    tile_id = self._find_tile_id_by_properties(tile)
-                    tile_row.append(tile_id)
-                self.level_map_data.append(tile_row)
+            tile_lookup = self._build_tile_lookup()
+            find_tile_id = self._find_tile_id_by_properties
+            self.level_map_data = [
+                [find_tile_id(tile, tile_lookup) for tile in row]
+                for row in map_tiles
+            ]
             
             # Parse entities (monsters + player)
             entities_data = data.get("entities", [])
@@ -2202,7 +2774,7 @@ class GameObjectEditor:
             # Store stairs position
             self.level_map_stairs_position = data.get("stairs_position")
             
-            self.render_level_map()
+            self.render_level_map(force=True)
             
             # Show level stats
             num_monsters = sum(1 for e in self.level_map_entities if e.get("controller") == "AI")
@@ -2216,239 +2788,303 @@ class GameObjectEditor:
         except Exception as e:
             self.log_status(f"Failed to generate level map: {e}", "error")
     
-    def render_level_map(self):
-        """Render the level map on the canvas"""
+    def _get_map_photos(self, attr, scaled_size):
+        """Tile PhotoImages for one map canvas, kept between renders at the same tile size
+        
+        Args:
+            attr: Attribute holding (scaled_size, photos) for that canvas
+        """
+        cached = getattr(self, attr, None)
+        if cached is None or cached[0] != scaled_size:
+            cached = (scaled_size, {})  # Zoom changed - the old images can go
+            setattr(self, attr, cached)
+        return cached[1]
+    
+    def _get_sprite_tile_photo(self, sprite_sheet, sprite_x, sprite_y, scaled_size, photos):
+        """Get a PhotoImage for one sprite tile, shared through photos across renders
+        
+        Args:
+            photos: Dict of PhotoImages at scaled_size; also keeps them alive for the canvas
+        
+        Returns:
+            The PhotoImage, or None if the sheet is missing or the tile can't be cropped
+        """
+        key = (sprite_sheet, sprite_x, sprite_y)
+        if key in photos:
+            return photos[key]
+        
+        sheet_path = self.assets_dir / sprite_sheet
+        try:
+            mtime = sheet_path.stat().st_mtime
+            tile = _crop_sprite_tile(str(sheet_path), mtime, sprite_x, sprite_y, self.tile_size, scaled_size)
+            photo = ImageTk.PhotoImage(tile)
+        except Exception:
+            photo = None
+        photos[key] = photo
+        return photo
+    
+    def _get_object_sprite_photo(self, obj, scaled_size, photos):
+        """Get the PhotoImage for an object's first sprite (see _get_sprite_tile_photo)"""
+        sprites = obj.get("sprites", [])
+        sprite = sprites[0] if sprites else {"x": 0, "y": 0}
+        return self._get_sprite_tile_photo(obj.get("sprite_sheet", "tiles.png"), sprite.get("x", 0),
+                                           sprite.get("y", 0), scaled_size, photos)
+    
+    def _get_map_object_lookups(self):
+        """Objects the map renderers need, indexed once per game_objects version
+        
+        Returns:
+            tuple: ({tile_id: tile_obj}, {character_id: character_obj}, first goal object or None)
+        """
+        cached = self._map_lookups_cache
+        if cached is not None and cached[0] == self._objects_version:
+            return cached[1]
+        tile_by_id = {}
+        char_by_id = {}
+        goal_obj = None
+        for obj in self.config.get("game_objects", []):
+            obj_type = obj.get("object_type")
+            if obj_type == "tile":
+                tile_by_id.setdefault(obj.get("id"), obj)  # First match wins, as before
+            elif obj_type == "character":
+                char_by_id.setdefault(obj.get("id"), obj)
+            elif obj_type == "goal" and goal_obj is None:
+                goal_obj = obj
+        lookups = (tile_by_id, char_by_id, goal_obj)
+        self._map_lookups_cache = (self._objects_version, lookups)
+        return lookups
+    
+    def _get_level_map_composite(self):
+        """The map's tiles composited at native tile size, rebuilt per map and game_objects version
+        
+        Returns:
+            RGBA image, with a gray placeholder for tiles that have no sprite
+        """
+        cached = getattr(self, '_level_map_composite', None)
+        if cached is not None and cached[0] == self._objects_version:
+            return cached[1]
+        
+        tile_size = self.tile_size
+        composite = Image.new("RGBA", (self.level_map_width * tile_size, self.level_map_height * tile_size))
+        tile_by_id = self._get_map_object_lookups()[0]
+        
+        # Resolve each distinct tile id to its image once - the grid itself only holds ids
+        placeholder = _placeholder_tile(tile_size)
+        tile_images = {}  # tile_id -> native tile image (placeholder if there's nothing to draw)
+        for tile_id in set().union(*self.level_map_data):
+            tile_obj = tile_by_id.get(tile_id)
+            tile = None
+            if tile_obj:
+                sprites = tile_obj.get("sprites", [])
+                sprite = sprites[0] if sprites else {"x": 0, "y": 0}
+                sheet_path = self.assets_dir / tile_obj.get("sprite_sheet", "tiles.png")
+                try:
+                    mtime = sheet_path.stat().st_mtime
+                    tile = _crop_sprite_tile(str(sheet_path), mtime, sprite.get("x", 0), sprite.get("y", 0),
+                                             tile_size, tile_size)
+                except Exception:
+                    pass
+            tile_images[tile_id] = tile if tile is not None else placeholder
+        
+        paste = composite.paste
+        for y, row in enumerate(self.level_map_data):
+            dest_y = y * tile_size
+            for x, tile_id in enumerate(row):
+                paste(tile_images[tile_id], (x * tile_size, dest_y))
+        
+        self._level_map_composite = (self._objects_version, composite)
+        return composite
+    
+    def _draw_level_map_tiles(self, canvas, scaled_size, offset_x, offset_y, photos, composite_attr):
+        """Draw the map tiles as one composited image (or per tile when zoomed in very far)
+        
+        Args:
+            photos: Per-tile PhotoImage cache for the canvas, used for the per-tile fallback
+            composite_attr: Attribute that keeps the composited PhotoImage alive for the canvas
+        """
+        width = self.level_map_width * scaled_size
+        height = self.level_map_height * scaled_size
+        if width * height > _MAX_COMPOSITE_PIXELS:
+            # A full-size composite would be huge - draw just the tiles in view instead
+            setattr(self, composite_attr, None)
+            self._culled_map_views[str(canvas)] = (scaled_size, offset_x, offset_y, photos)
+            self._draw_visible_map_tiles(canvas)
+            return
+        
+        self._culled_map_views.pop(str(canvas), None)
+        composite = self._get_level_map_composite()
+        if scaled_size != self.tile_size:
+            composite = composite.resize((width, height), Image.Resampling.NEAREST)
+        photo = ImageTk.PhotoImage(composite)
+        setattr(self, composite_attr, photo)
+        canvas.create_image(offset_x, offset_y, anchor=tk.NW, image=photo)
+    
+    def _draw_visible_map_tiles(self, canvas):
+        """(Re)draw the per-tile map items that fall inside a canvas's visible area
+        
+        Only used when the map is too large to composite; called again as the view
+        scrolls or resizes. One PhotoImage is shared per distinct tile.
+        """
+        view = self._culled_map_views.get(str(canvas))
+        if view is None or not self.level_map_data:
+            return
+        scaled_size, offset_x, offset_y, photos = view
+        canvas.delete("map_tile")
+        
+        # Visible tile range (plus the partly visible tiles at the edges)
+        left = canvas.canvasx(0) - offset_x
+        top = canvas.canvasy(0) - offset_y
+        first_x = max(0, int(left // scaled_size))
+        first_y = max(0, int(top // scaled_size))
+        last_x = min(self.level_map_width, int((left + canvas.winfo_width()) // scaled_size) + 1)
+        last_y = min(self.level_map_height, int((top + canvas.winfo_height()) // scaled_size) + 1)
+        
+        tile_by_id = self._get_map_object_lookups()[0]
+        if None not in photos:  # Shared gray placeholder for tiles with no sprite
+            photos[None] = ImageTk.PhotoImage(_placeholder_tile(scaled_size))
+        placeholder = photos[None]
+        for y in range(first_y, last_y):
+            row = self.level_map_data[y]
+            dest_y = offset_y + y * scaled_size
+            for x in range(first_x, min(last_x, len(row))):
+                tile_obj = tile_by_id.get(row[x])
+                sprite_photo = None
+                if tile_obj:
+                    sprites = tile_obj.get("sprites", [])
+                    sprite = sprites[0] if sprites else {"x": 0, "y": 0}
+                    sprite_photo = self._get_sprite_tile_photo(
+                        tile_obj.get("sprite_sheet", "tiles.png"), sprite.get("x", 0), sprite.get("y", 0),
+                        scaled_size, photos)
+                canvas.create_image(offset_x + x * scaled_size, dest_y, anchor=tk.NW,
+                                    image=sprite_photo or placeholder, tags="map_tile")
+        # Keep entities and stairs on top
+        canvas.tag_lower("map_tile")
+    
+    def _on_level_map_scroll(self, view_method, *args):
+        """Scrollbar command for the level map canvas - scroll, then fill in newly exposed tiles"""
+        view_method(*args)
+        self._draw_visible_map_tiles(self.level_map_canvas)
+    
+    def render_level_map(self, force=False):
+        """Render the level map on the canvas
+        
+        Args:
+            force: Redraw even if nothing that affects the drawing changed (e.g. a new map)
+        """
         if not self.level_map_data:
             return
         
+        scaled_size = int(self.tile_size * self.level_map_zoom_level)
+        render_key = (scaled_size, id(self.level_map_data), id(self.level_map_entities),
+                      self.level_map_stairs_position, self._objects_version)
+        if not force and render_key == getattr(self, '_last_render_key', None):
+            return  # e.g. zoom clamped at its limit
+        self._last_render_key = render_key
+        
         self.level_map_canvas.delete("all")
         
-        # Clear previous sprite image references
-        if hasattr(self, '_level_map_sprite_images'):
-            self._level_map_sprite_images.clear()
-        else:
-            self._level_map_sprite_images = []
+        photos = self._get_map_photos('_level_map_sprite_images', scaled_size)
+        _, char_by_id, goal_obj = self._get_map_object_lookups()
         
-        # Load sprite sheets if needed
-        sprite_sheets = {}
+        # Render the tiles
+        self._draw_level_map_tiles(self.level_map_canvas, scaled_size, 0, 0, photos,
+                                   '_level_map_composite_photo')
         
-        # Render each tile
-        for y in range(self.level_map_height):
-            for x in range(self.level_map_width):
-                tile_id = self.level_map_data[y][x]
-                
-                # Find the tile object
-                tile_obj = None
-                for obj in self.config.get("game_objects", []):
-                    if obj.get("id") == tile_id and obj.get("object_type") == "tile":
-                        tile_obj = obj
-                        break
-                
-                if not tile_obj:
-                    scaled_size = int(self.tile_size * self.level_map_zoom_level)
-                    self.level_map_canvas.create_rectangle(
-                        x * scaled_size, y * scaled_size,
-                        (x + 1) * scaled_size, (y + 1) * scaled_size,
-                        fill="gray", outline="black"
-                    )
-                    continue
-                
-                # Get sprite coordinates
-                sprites = tile_obj.get("sprites", [])
-                if not sprites:
-                    sprite_x = tile_obj.get("sprite_x", 0)
-                    sprite_y = tile_obj.get("sprite_y", 0)
-                    sprites = [{"x": sprite_x, "y": sprite_y}]
-                
-                sprite = sprites[0] if sprites else {"x": 0, "y": 0}
-                sprite_x = sprite.get("x", 0)
-                sprite_y = sprite.get("y", 0)
-                sprite_sheet = tile_obj.get("sprite_sheet", "tiles.png")
-                
-                # Load sprite sheet if not already loaded
-                if sprite_sheet not in sprite_sheets:
-                    sheet_path = self.assets_dir / sprite_sheet
-                    if sheet_path.exists():
-                        try:
-                            img = Image.open(sheet_path)
-                            sprite_sheets[sprite_sheet] = img
-                        except Exception as e:
-                            sprite_sheets[sprite_sheet] = None
-                    else:
-                        sprite_sheets[sprite_sheet] = None
-                
-                # Draw the tile
-                if sprite_sheets.get(sprite_sheet):
-                    img = sprite_sheets[sprite_sheet]
-                    left = sprite_x * self.tile_size
-                    top = sprite_y * self.tile_size
-                    right = left + self.tile_size
-                    bottom = top + self.tile_size
-                    
-                    try:
-                        sprite_img = img.crop((left, top, right, bottom))
-                        scaled_size = int(self.tile_size * self.level_map_zoom_level)
-                        sprite_img = sprite_img.resize((scaled_size, scaled_size), Image.NEAREST)
-                        sprite_photo = ImageTk.PhotoImage(sprite_img)
-                        
-                        self._level_map_sprite_images.append(sprite_photo)
-                        
-                        dest_x = x * scaled_size
-                        dest_y = y * scaled_size
-                        self.level_map_canvas.create_image(
-                            dest_x, dest_y,
-                            anchor=tk.NW, image=sprite_photo
-                        )
-                    except Exception:
-                        scaled_size = int(self.tile_size * self.level_map_zoom_level)
-                        self.level_map_canvas.create_rectangle(
-                            x * scaled_size, y * scaled_size,
-                            (x + 1) * scaled_size, (y + 1) * scaled_size,
-                            fill="gray", outline="black"
-                        )
-                else:
-                    scaled_size = int(self.tile_size * self.level_map_zoom_level)
-                    self.level_map_canvas.create_rectangle(
-                        x * scaled_size, y * scaled_size,
-                        (x + 1) * scaled_size, (y + 1) * scaled_size,
-                        fill="gray", outline="black"
-                    )
+        canvas = self.level_map_canvas
+        border_width = max(2, int(3 * self.level_map_zoom_level))
         
         # Draw entities (monsters and players)
+        entity_photos = {}  # object_id -> PhotoImage, resolved once per render
         for entity in self.level_map_entities:
-            x = entity.get("x", 0)
-            y = entity.get("y", 0)
             object_id = entity.get("object_id", "")
-            controller = entity.get("controller", "AI")
-            
-            # Find the character object
-            char_obj = None
-            for obj in self.config.get("game_objects", []):
-                if obj.get("id") == object_id and obj.get("object_type") == "character":
-                    char_obj = obj
-                    break
+            if object_id not in entity_photos:
+                char_obj = char_by_id.get(object_id)
+                entity_photos[object_id] = (
+                    self._get_object_sprite_photo(char_obj, scaled_size, photos) if char_obj else None)
+            sprite_photo = entity_photos[object_id]
             
-            if char_obj:
-                sprites = char_obj.get("sprites", [])
-                if not sprites:
-                    sprite_x = char_obj.get("sprite_x", 0)
-                    sprite_y = char_obj.get("sprite_y", 0)
-                    sprites = [{"x": sprite_x, "y": sprite_y}]
-                
-                sprite = sprites[0] if sprites else {"x": 0, "y": 0}
-                sprite_x = sprite.get("x", 0)
-                sprite_y = sprite.get("y", 0)
-                sprite_sheet = char_obj.get("sprite_sheet", "tiles.png")
-                
-                sheet_path = self.assets_dir / sprite_sheet
-                if sheet_path.exists():
-                    try:
-                        img = Image.open(sheet_path)
-                        left = sprite_x * self.tile_size
-                        top = sprite_y * self.tile_size
-                        right = left + self.tile_size
-                        bottom = top + self.tile_size
-                        
-                        sprite_img = img.crop((left, top, right, bottom))
-                        scaled_size = int(self.tile_size * self.level_map_zoom_level)
-                        sprite_img = sprite_img.resize((scaled_size, scaled_size), Image.NEAREST)
-                        sprite_photo = ImageTk.PhotoImage(sprite_img)
-                        
-                        self._level_map_sprite_images.append(sprite_photo)
-                        
-                        dest_x = x * scaled_size
-                        dest_y = y * scaled_size
-                        self.level_map_canvas.create_image(
-                            dest_x, dest_y,
-                            anchor=tk.NW, image=sprite_photo
-                        )
-                        
-                        # Add colored border: green for player, red for monsters
-                        border_color = "green" if controller == "Player" else "red"
-                        self.level_map_canvas.create_rectangle(
-                            dest_x, dest_y,
-                            dest_x + scaled_size, dest_y + scaled_size,
-                            outline=border_color, width=max(2, int(3 * self.level_map_zoom_level))
-                        )
-                    except Exception:
-                        pass
+            if sprite_photo:
+                x = entity.get("x", 0)
+                y = entity.get("y", 0)
+                controller = entity.get("controller", "AI")
+                try:
+                    dest_x = x * scaled_size
+                    dest_y = y * scaled_size
+                    canvas.create_image(
+                        dest_x, dest_y,
+                        anchor=tk.NW, image=sprite_photo
+                    )
+                    
+                    # Add colored border: green for player, red for monsters
+                    border_color = "green" if controller == "Player" else "red"
+                    canvas.create_rectangle(
+                        dest_x, dest_y,
+                        dest_x + scaled_size, dest_y + scaled_size,
+                        outline=border_color, width=border_width
+                    )
+                except Exception:
+                    pass
         
         # Draw stairs
         if self.level_map_stairs_position:
             stairs_x, stairs_y = self.level_map_stairs_position
-            stairs_obj = None
-            for obj in self.config.get("game_objects", []):
-                if obj.get("object_type") == "goal":
-                    stairs_obj = obj
-                    break
-            
-            if stairs_obj:
-                sprites = stairs_obj.get("sprites", [])
-                if not sprites:
-                    sprite_x = stairs_obj.get("sprite_x", 0)
-                    sprite_y = stairs_obj.get("sprite_y", 0)
-                    sprites = [{"x": sprite_x, "y": sprite_y}]
-                
-                sprite = sprites[0] if sprites else {"x": 0, "y": 0}
-                sprite_x = sprite.get("x", 0)
-                sprite_y = sprite.get("y", 0)
-                sprite_sheet = stairs_obj.get("sprite_sheet", "tiles.png")
-                
-                sheet_path = self.assets_dir / sprite_sheet
-                if sheet_path.exists():
+            if goal_obj:
+                sprite_photo = self._get_object_sprite_photo(goal_obj, scaled_size, photos)
+                if sprite_photo:
                     try:
-                        img = Image.open(sheet_path)
-                        left = sprite_x * self.tile_size
-                        top = sprite_y * self.tile_size
-                        right = left + self.tile_size
-                        bottom = top + self.tile_size
-                        
-                        sprite_img = img.crop((left, top, right, bottom))
-                        scaled_size = int(self.tile_size * self.level_map_zoom_level)
-                        sprite_img = sprite_img.resize((scaled_size, scaled_size), Image.NEAREST)
-                        sprite_photo = ImageTk.PhotoImage(sprite_img)
-                        
-                        self._level_map_sprite_images.append(sprite_photo)
-                        
                         dest_x = stairs_x * scaled_size
                         dest_y = stairs_y * scaled_size
-                        self.level_map_canvas.create_image(
+                        canvas.create_image(
                             dest_x, dest_y,
                             anchor=tk.NW, image=sprite_photo
                         )
                         
                         # Add bright cyan border
-                        self.level_map_canvas.create_rectangle(
+                        canvas.create_rectangle(
                             dest_x, dest_y,
                             dest_x + scaled_size, dest_y + scaled_size,
-                            outline="cyan", width=max(2, int(3 * self.level_map_zoom_level))
+                            outline="cyan", width=border_width
                         )
                     except Exception:
                         pass
         
-        # Update scroll region
-        self.level_map_canvas.config(scrollregion=self.level_map_canvas.bbox("all"))
+        # Update scroll region (to the whole map - far-zoomed maps only draw the tiles in view)
+        self.level_map_canvas.config(scrollregion=(0, 0, self.level_map_width * scaled_size,
+                                                   self.level_map_height * scaled_size))
+    
+    def _schedule_map_render(self, render):
+        """Redraw a level map view once the event queue is idle
+        
+        A burst of wheel events only updates the zoom level; the map is drawn once after it.
+        """
+        if render.__name__ not in self._map_render_jobs:
+            self._map_render_jobs[render.__name__] = self.root.after_idle(self._run_map_render, render)
+    
+    def _run_map_render(self, render):
+        """Run a render scheduled by _schedule_map_render"""
+        self._map_render_jobs.pop(render.__name__, None)
+        render()
     
     def level_map_zoom_in(self):
         """Zoom in on level map"""
         self.level_map_zoom_level = min(self.level_map_zoom_level * 1.2, 5.0)
         self.level_map_zoom_label.config(text=f"Zoom: {int(self.level_map_zoom_level * 100)}%")
         if self.level_map_data:
-            self.render_level_map()
+            self._schedule_map_render(self.render_level_map)
     
     def level_map_zoom_out(self):
         """Zoom out on level map"""
         self.level_map_zoom_level = max(self.level_map_zoom_level / 1.2, 0.1)
         self.level_map_zoom_label.config(text=f"Zoom: {int(self.level_map_zoom_level * 100)}%")
         if self.level_map_data:
-            self.render_level_map()
+            self._schedule_map_render(self.render_level_map)
     
     def level_map_zoom_reset(self):
         """Reset level map zoom"""
         self.level_map_zoom_level = 1.0
         self.level_map_zoom_label.config(text="Zoom: 100%")
         if self.level_map_data:
-            self.render_level_map()
+            self._schedule_map_render(self.render_level_map)
     
     def on_level_map_mousewheel(self, event):
         """Handle mouse wheel for level map zoom"""
@@ -2511,6 +3147,10 @@ class GameObjectEditor:
         self.level_map_fullscreen_canvas.bind("<Button-4>", lambda e: self.level_map_fullscreen_zoom_in())
         self.level_map_fullscreen_canvas.bind("<Button-5>", lambda e: self.level_map_fullscreen_zoom_out())
         self.level_map_fullscreen_canvas.bind("<Enter>", lambda e: self.level_map_fullscreen_canvas.focus_set())
+        self.level_map_fullscreen_canvas.bind(
+            "<Configure>", lambda e: self._draw_visible_map_tiles(self.level_map_fullscreen_canvas))
+        self.level_map_fullscreen_canvas.bind(
+            "<Destroy>", partial(self._on_level_map_fullscreen_destroy, str(self.level_map_fullscreen_canvas)))
         
         # Use current zoom level for fullscreen (or keep existing if already set)
         if self.level_map_fullscreen_zoom_level == 1.0:
@@ -2529,12 +3169,6 @@ class GameObjectEditor:
         
         self.level_map_fullscreen_canvas.delete("all")
         
-        # Clear previous sprite image references
-        if hasattr(self, '_level_map_fullscreen_sprite_images'):
-            self._level_map_fullscreen_sprite_images.clear()
-        else:
-            self._level_map_fullscreen_sprite_images = []
-        
         # Get window size
         window_width = self.level_map_fullscreen_window.winfo_width()
         window_height = self.level_map_fullscreen_window.winfo_height()
@@ -2553,220 +3187,95 @@ class GameObjectEditor:
             offset_y = 0
             tile_size_scaled = int(self.tile_size * self.level_map_fullscreen_zoom_level)
         
-        # Load sprite sheets
-        sprite_sheets = {}
+        photos = self._get_map_photos('_level_map_fullscreen_sprite_images', tile_size_scaled)
+        _, char_by_id, goal_obj = self._get_map_object_lookups()
         
-        # Render each tile
-        for y in range(self.level_map_height):
-            for x in range(self.level_map_width):
-                tile_id = self.level_map_data[y][x]
-                
-                # Find the tile object
-                tile_obj = None
-                for obj in self.config.get("game_objects", []):
-                    if obj.get("id") == tile_id and obj.get("object_type") == "tile":
-                        tile_obj = obj
-                        break
-                
-                if not tile_obj:
+        # Render the tiles
+        self._draw_level_map_tiles(self.level_map_fullscreen_canvas, tile_size_scaled, offset_x, offset_y,
+                                   photos, '_level_map_fullscreen_composite_photo')
+        
+        canvas = self.level_map_fullscreen_canvas
+        border_width = max(2, int(3 * self.level_map_fullscreen_zoom_level))
+        
+        # Draw entities
+        entity_photos = {}  # object_id -> PhotoImage, resolved once per render
+        for entity in self.level_map_entities:
+            object_id = entity.get("object_id", "")
+            if object_id not in entity_photos:
+                char_obj = char_by_id.get(object_id)
+                entity_photos[object_id] = (
+                    self._get_object_sprite_photo(char_obj, tile_size_scaled, photos) if char_obj else None)
+            sprite_photo = entity_photos[object_id]
+            
+            if sprite_photo:
+                x = entity.get("x", 0)
+                y = entity.get("y", 0)
+                controller = entity.get("controller", "AI")
+                try:
                     dest_x = offset_x + x * tile_size_scaled
                     dest_y = offset_y + y * tile_size_scaled
-                    self.level_map_fullscreen_canvas.create_rectangle(
+                    canvas.create_image(
                         dest_x, dest_y,
-                        dest_x + tile_size_scaled, dest_y + tile_size_scaled,
-                        fill="gray", outline="black"
+                        anchor=tk.NW, image=sprite_photo
                     )
-                    continue
-                
-                # Get sprite coordinates
-                sprites = tile_obj.get("sprites", [])
-                if not sprites:
-                    sprite_x = tile_obj.get("sprite_x", 0)
-                    sprite_y = tile_obj.get("sprite_y", 0)
-                    sprites = [{"x": sprite_x, "y": sprite_y}]
-                
-                sprite = sprites[0] if sprites else {"x": 0, "y": 0}
-                sprite_x = sprite.get("x", 0)
-                sprite_y = sprite.get("y", 0)
-                sprite_sheet = tile_obj.get("sprite_sheet", "tiles.png")
-                
-                # Load sprite sheet if not already loaded
-                if sprite_sheet not in sprite_sheets:
-                    sheet_path = self.assets_dir / sprite_sheet
-                    if sheet_path.exists():
-                        try:
-                            img = Image.open(sheet_path)
-                            sprite_sheets[sprite_sheet] = img
-                        except Exception:
-                            sprite_sheets[sprite_sheet] = None
-                    else:
-                        sprite_sheets[sprite_sheet] = None
-                
-                # Draw the tile
-                if sprite_sheets.get(sprite_sheet):
-                    img = sprite_sheets[sprite_sheet]
-                    left = sprite_x * self.tile_size
-                    top = sprite_y * self.tile_size
-                    right = left + self.tile_size
-                    bottom = top + self.tile_size
                     
-                    try:
-                        sprite_img = img.crop((left, top, right, bottom))
-                        sprite_img = sprite_img.resize((tile_size_scaled, tile_size_scaled), Image.NEAREST)
-                        sprite_photo = ImageTk.PhotoImage(sprite_img)
-                        
-                        self._level_map_fullscreen_sprite_images.append(sprite_photo)
-                        
-                        dest_x = offset_x + x * tile_size_scaled
-                        dest_y = offset_y + y * tile_size_scaled
-                        self.level_map_fullscreen_canvas.create_image(
-                            dest_x, dest_y,
-                            anchor=tk.NW, image=sprite_photo
-                        )
-                    except Exception:
-                        dest_x = offset_x + x * tile_size_scaled
-                        dest_y = offset_y + y * tile_size_scaled
-                        self.level_map_fullscreen_canvas.create_rectangle(
-                            dest_x, dest_y,
-                            dest_x + tile_size_scaled, dest_y + tile_size_scaled,
-                            fill="gray", outline="black"
-                        )
-                else:
-                    dest_x = offset_x + x * tile_size_scaled
-                    dest_y = offset_y + y * tile_size_scaled
-                    self.level_map_fullscreen_canvas.create_rectangle(
+                    border_color = "green" if controller == "Player" else "red"
+                    canvas.create_rectangle(
                         dest_x, dest_y,
                         dest_x + tile_size_scaled, dest_y + tile_size_scaled,
-                        fill="gray", outline="black"
+                        outline=border_color, width=border_width
                     )
-        
-        # Draw entities
-        for entity in self.level_map_entities:
-            x = entity.get("x", 0)
-            y = entity.get("y", 0)
-            object_id = entity.get("object_id", "")
-            controller = entity.get("controller", "AI")
-            
-            char_obj = None
-            for obj in self.config.get("game_objects", []):
-                if obj.get("id") == object_id and obj.get("object_type") == "character":
-                    char_obj = obj
-                    break
-            
-            if char_obj:
-                sprites = char_obj.get("sprites", [])
-                if not sprites:
-                    sprite_x = char_obj.get("sprite_x", 0)
-                    sprite_y = char_obj.get("sprite_y", 0)
-                    sprites = [{"x": sprite_x, "y": sprite_y}]
-                
-                sprite = sprites[0] if sprites else {"x": 0, "y": 0}
-                sprite_x = sprite.get("x", 0)
-                sprite_y = sprite.get("y", 0)
-                sprite_sheet = char_obj.get("sprite_sheet", "tiles.png")
-                
-                sheet_path = self.assets_dir / sprite_sheet
-                if sheet_path.exists():
-                    try:
-                        img = Image.open(sheet_path)
-                        left = sprite_x * self.tile_size
-                        top = sprite_y * self.tile_size
-                        right = left + self.tile_size
-                        bottom = top + self.tile_size
-                        
-                        sprite_img = img.crop((left, top, right, bottom))
-                        sprite_img = sprite_img.resize((tile_size_scaled, tile_size_scaled), Image.NEAREST)
-                        sprite_photo = ImageTk.PhotoImage(sprite_img)
-                        
-                        self._level_map_fullscreen_sprite_images.append(sprite_photo)
-                        
-                        dest_x = offset_x + x * tile_size_scaled
-                        dest_y = offset_y + y * tile_size_scaled
-                        self.level_map_fullscreen_canvas.create_image(
-                            dest_x, dest_y,
-                            anchor=tk.NW, image=sprite_photo
-                        )
-                        
-                        border_color = "green" if controller == "Player" else "red"
-                        self.level_map_fullscreen_canvas.create_rectangle(
-                            dest_x, dest_y,
-                            dest_x + tile_size_scaled, dest_y + tile_size_scaled,
-                            outline=border_color, width=max(2, int(3 * self.level_map_fullscreen_zoom_level))
-                        )
-                    except Exception:
-                        pass
+                except Exception:
+                    pass
         
         # Draw stairs
         if self.level_map_stairs_position:
             stairs_x, stairs_y = self.level_map_stairs_position
-            stairs_obj = None
-            for obj in self.config.get("game_objects", []):
-                if obj.get("object_type") == "goal":
-                    stairs_obj = obj
-                    break
-            
-            if stairs_obj:
-                sprites = stairs_obj.get("sprites", [])
-                if not sprites:
-                    sprite_x = stairs_obj.get("sprite_x", 0)
-                    sprite_y = stairs_obj.get("sprite_y", 0)
-                    sprites = [{"x": sprite_x, "y": sprite_y}]
-                
-                sprite = sprites[0] if sprites else {"x": 0, "y": 0}
-                sprite_x = sprite.get("x", 0)
-                sprite_y = sprite.get("y", 0)
-                sprite_sheet = stairs_obj.get("sprite_sheet", "tiles.png")
-                
-                sheet_path = self.assets_dir / sprite_sheet
-                if sheet_path.exists():
+            if goal_obj:
+                sprite_photo = self._get_object_sprite_photo(goal_obj, tile_size_scaled, photos)
+                if sprite_photo:
                     try:
-                        img = Image.open(sheet_path)
-                        left = sprite_x * self.tile_size
-                        top = sprite_y * self.tile_size
-                        right = left + self.tile_size
-                        bottom = top + self.tile_size
-                        
-                        sprite_img = img.crop((left, top, right, bottom))
-                        sprite_img = sprite_img.resize((tile_size_scaled, tile_size_scaled), Image.NEAREST)
-                        sprite_photo = ImageTk.PhotoImage(sprite_img)
-                        
-                        self._level_map_fullscreen_sprite_images.append(sprite_photo)
-                        
                         dest_x = offset_x + stairs_x * tile_size_scaled
                         dest_y = offset_y + stairs_y * tile_size_scaled
-                        self.level_map_fullscreen_canvas.create_image(
+                        canvas.create_image(
                             dest_x, dest_y,
                             anchor=tk.NW, image=sprite_photo
                         )
                         
-                        self.level_map_fullscreen_canvas.create_rectangle(
+                        canvas.create_rectangle(
                             dest_x, dest_y,
                             dest_x + tile_size_scaled, dest_y + tile_size_scaled,
-                            outline="cyan", width=max(2, int(3 * self.level_map_fullscreen_zoom_level))
+                            outline="cyan", width=border_width
                         )
                     except Exception:
                         pass
     
+    def _on_level_map_fullscreen_destroy(self, canvas_path, event=None):
+        """Drop the fullscreen canvas's map images once it's gone, so they don't outlive the window"""
+        self._culled_map_views.pop(canvas_path, None)
+        self._level_map_fullscreen_composite_photo = None
+        self._level_map_fullscreen_sprite_images = None
+    
     def level_map_fullscreen_zoom_in(self):
         """Zoom in on fullscreen map"""
         self.level_map_fullscreen_zoom_level = min(self.level_map_fullscreen_zoom_level * 1.2, 5.0)
         self.level_map_fullscreen_zoom_label.config(text=f"Zoom: {int(self.level_map_fullscreen_zoom_level * 100)}%")
         if self.level_map_data:
-            self.render_level_map_fullscreen()
+            self._schedule_map_render(self.render_level_map_fullscreen)
     
     def level_map_fullscreen_zoom_out(self):
         """Zoom out on fullscreen map"""
         self.level_map_fullscreen_zoom_level = max(self.level_map_fullscreen_zoom_level / 1.2, 0.1)
         self.level_map_fullscreen_zoom_label.config(text=f"Zoom: {int(self.level_map_fullscreen_zoom_level * 100)}%")
         if self.level_map_data:
-            self.render_level_map_fullscreen()
+            self._schedule_map_render(self.render_level_map_fullscreen)
     
     def level_map_fullscreen_zoom_reset(self):
         """Reset fullscreen map zoom"""
         self.level_map_fullscreen_zoom_level = 1.0
         self.level_map_fullscreen_zoom_label.config(text="Zoom: 100%")
         if self.level_map_data:
-            self.render_level_map_fullscreen()
+            self._schedule_map_render(self.render_level_map_fullscreen)
     
     def on_level_map_fullscreen_mousewheel(self, event):
         """Handle mouse wheel for fullscreen map zoom"""
@@ -0,0 +1,78 @@
+"""Tests for GameEditor that run without a display"""
+import unittest
+
+from GameEditor import GameObjectEditor
+
+
+class _Var:
+    """Stand-in for a Tk variable"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class _Root:
+    """Stand-in for the Tk root that records cancelled after() jobs"""
+
+    def __init__(self):
+        self.cancelled = []
+
+    def after_cancel(self, job):
+        self.cancelled.append(job)
+
+
+class _Panel:
+    def winfo_children(self):
+        return []
+
+
+class ApplySchemaTest(unittest.TestCase):
+    def _make_editor(self):
+        editor = GameObjectEditor.__new__(GameObjectEditor)
+        editor.root = _Root()
+        editor.middle_panel = _Panel()
+        editor.current_object = {"id": "orc", "name": "Orc", "object_type": "character"}
+        editor.current_object_idx = 0
+        editor.config = {"game_objects": [editor.current_object]}
+        editor.prop_vars = {}
+        editor._sprite_coords = []
+        editor._valid_objects = {}
+        editor._display_cache = None
+        editor._dirty_ids = set()
+        editor._objects_version = 0
+        editor._auto_save_job = None
+        # Widget work is out of scope here
+        editor._build_property_panel = lambda panel: setattr(editor, "prop_vars", {})
+        editor.refresh_sprite_sheets = lambda: None
+        editor.refresh_object_list = lambda preserve_selection=False: None
+        editor._schedule_flush = lambda: None
+        editor.load_object_to_form = lambda: None
+        return editor
+
+    def test_pending_edit_is_applied_before_rebuild(self):
+        editor = self._make_editor()
+        # An edit typed just before the schema arrives, still waiting on its debounce
+        editor.prop_vars = {"name": (_Var("Orc Chief"), str)}
+        editor._auto_save_job = "after#1"
+
+        editor._apply_schema({"fields": []})
+
+        self.assertEqual(editor.current_object["name"], "Orc Chief")
+        self.assertEqual(editor.root.cancelled, ["after#1"])
+        self.assertIsNone(editor._auto_save_job)
+        self.assertIn("orc", editor._dirty_ids)
+
+    def test_no_pending_edit(self):
+        editor = self._make_editor()
+
+        editor._apply_schema({"fields": []})
+
+        self.assertEqual(editor.current_object["name"], "Orc")
+        self.assertEqual(editor.root.cancelled, [])
+
+
+if __name__ == "__main__":
+    unittest.main()